@@ -21,7 +21,7 @@ Token stream (until EOF):
 Core invariant: phraseweave_decode(phraseweave_encode(x)) == x
 """
 
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 
 from .types import (
     Config,
@@ -50,6 +50,10 @@ class DecodingError(PhraseWeaveError):
     pass
 
 
+# LITERAL token bytes for every byte value
+_LITERAL_TOKENS = [bytes([TokenType.LITERAL, value]) for value in range(256)]
+
+
 def _build_reverse_index(dictionary: Dictionary, config: Config) -> dict:
     """
     Build reverse index from raw_form -> stan_id.
@@ -99,46 +103,37 @@ def phraseweave_encode(
     # Build reverse index for matching
     reverse_index = _build_reverse_index(dictionary, config)
 
-    # Sort by length descending for greedy matching
-    sorted_patterns = sorted(
-        reverse_index.keys(),
-        key=lambda x: len(x),
-        reverse=True
-    )
-
-    # Encode token stream
+    # Greedy matching tries the longest pattern first; keys are distinct, so
+    # probing the index once per distinct length (longest first) finds the
+    # same match as comparing against every pattern
+    pattern_lengths = sorted({len(pattern) for pattern in reverse_index}, reverse=True)
+    if not config.greedy:
+        pattern_lengths = []
+
+    # Encode token stream straight into the output, reusing token bytes
+    stan_tokens = {
+        pattern: bytes([TokenType.STAN]) + encode_varint(stan_id)
+        for pattern, stan_id in reverse_index.items()
+    }
     pos = 0
-    tokens: List[Tuple[TokenType, bytes]] = []
-    last_expansion: Optional[bytes] = None
-
-    while pos < len(raw):
-        matched = False
-
-        if config.greedy and sorted_patterns:
-            # Try to match longest patterns first
-            for pattern in sorted_patterns:
-                if raw[pos:pos + len(pattern)] == pattern:
-                    stan_id = reverse_index[pattern]
-                    token_data = bytes([TokenType.STAN]) + encode_varint(stan_id)
-                    tokens.append((TokenType.STAN, token_data))
-                    metadata.stan_count += 1
-                    last_expansion = pattern
-                    pos += len(pattern)
-                    matched = True
-                    break
-
-        if not matched:
+    raw_len = len(raw)
+
+    while pos < raw_len:
+        for length in pattern_lengths:
+            if pos + length > raw_len:
+                continue
+            token_data = stan_tokens.get(raw[pos:pos + length])
+            if token_data is not None:
+                result.extend(token_data)
+                metadata.stan_count += 1
+                pos += length
+                break
+        else:
             # Emit literal byte
-            token_data = bytes([TokenType.LITERAL, raw[pos]])
-            tokens.append((TokenType.LITERAL, token_data))
+            result.extend(_LITERAL_TOKENS[raw[pos]])
             metadata.literal_count += 1
-            last_expansion = bytes([raw[pos]])
             pos += 1
 
-    # Flatten tokens to bytes
-    for _, token_data in tokens:
-        result.extend(token_data)
-
     woven = bytes(result)
     metadata.woven_len = len(woven)
 
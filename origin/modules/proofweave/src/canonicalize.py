@@ -57,16 +57,6 @@ def is_blake3_available() -> bool:
     return _check_blake3()
 
 
-def _sort_keys_recursive(obj: Any) -> Any:
-    """Recursively sort all dictionary keys."""
-    if isinstance(obj, dict):
-        return {k: _sort_keys_recursive(v) for k, v in sorted(obj.items())}
-    elif isinstance(obj, list):
-        return [_sort_keys_recursive(item) for item in obj]
-    else:
-        return obj
-
-
 def canonicalize_pwof(pwof: Dict[str, Any]) -> bytes:
     """
     Canonicalize a PWOF object to deterministic bytes.
@@ -77,12 +67,10 @@ def canonicalize_pwof(pwof: Dict[str, Any]) -> bytes:
     Returns:
         Canonical UTF-8 encoded JSON bytes
     """
-    # Sort all keys recursively
-    sorted_obj = _sort_keys_recursive(pwof)
-
-    # Serialize with no whitespace, sorted keys, no ensure_ascii
+    # Serialize with no whitespace, sorted keys, no ensure_ascii; sort_keys
+    # orders every nested object too, inside the C encoder
     canonical = json.dumps(
-        sorted_obj,
+        pwof,
         separators=(',', ':'),
         sort_keys=True,
         ensure_ascii=False,
@@ -189,14 +177,13 @@ def verify_hash(pwof: Dict[str, Any], expected_hash: str,
         computed = compute_hash(pwof, algorithm, warn_on_fallback=False)
         return computed == expected_hash
 
-    # Try both algorithms if not specified
-    sha256_hash = compute_hash(pwof, 'sha256')
-    if sha256_hash == expected_hash:
+    # Try both algorithms if not specified, over one canonical serialization
+    canonical = canonicalize_pwof(pwof)
+    if hashlib.sha256(canonical).hexdigest() == expected_hash:
         return True
 
     if _check_blake3():
-        blake3_hash = compute_hash(pwof, 'blake3', warn_on_fallback=False)
-        if blake3_hash == expected_hash:
+        if _blake3_module.blake3(canonical).hexdigest() == expected_hash:
             return True
 
     return False
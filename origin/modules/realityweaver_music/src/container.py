@@ -124,11 +124,12 @@ def _make_rwv1_config(config: RXMConfig) -> RWV1Config:
 
 def _encode_sync(sync_entries: List[SyncEntry]) -> bytes:
     """Encode sync entries to binary format."""
-    result = bytearray()
-    result.extend(struct.pack(">I", len(sync_entries)))
+    values = []
     for entry in sync_entries:
-        result.extend(struct.pack(">II", entry.score_tick, entry.audio_frame))
-    return bytes(result)
+        values.append(entry.score_tick)
+        values.append(entry.audio_frame)
+    # Count plus all (tick, frame) pairs in one pack call
+    return struct.pack(f">I{len(values)}I", len(sync_entries), *values)
 
 
 def _decode_sync(data: bytes) -> List[SyncEntry]:
@@ -141,14 +142,10 @@ def _decode_sync(data: bytes) -> List[SyncEntry]:
     if len(data) < expected_size:
         raise RXMError(f"SYNC chunk truncated: expected {expected_size} bytes, got {len(data)}")
 
-    entries = []
-    pos = 4
-    for _ in range(count):
-        score_tick, audio_frame = struct.unpack(">II", data[pos:pos + 8])
-        entries.append(SyncEntry(score_tick=score_tick, audio_frame=audio_frame))
-        pos += 8
-
-    return entries
+    return [
+        SyncEntry(score_tick=score_tick, audio_frame=audio_frame)
+        for score_tick, audio_frame in struct.iter_unpack(">II", memoryview(data)[4:expected_size])
+    ]
 
 
 def validate_sync(sync_entries: List[SyncEntry]) -> None:
@@ -17,6 +17,8 @@ setup(
     extras_require={
         "ffmpeg": ["ffmpeg-python"],
         "metrics": ["vmaf"],
+        "json": ["orjson"],
+        "scenedetect": ["scenedetect[opencv]"],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
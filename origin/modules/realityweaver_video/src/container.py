@@ -11,22 +11,23 @@ re-weaving, and decoupling encoding logic from codecs.
 Binary Format Specification (Version 1):
 =========================================
 
-Header (fixed 64 bytes):
+Header (fixed 68 bytes):
   Offset  Size  Field
   ------  ----  -----
   0       4     Magic: "RWVV" (0x52 0x57 0x56 0x56)
   4       1     Version: 1
-  5       1     Flags: bit 0 = has_checksum, bit 1 = compressed_index
+  5       1     Flags: bit 0 = has_checksum, bit 1 = compressed_index,
+                       bit 2 = compact_index
   6       2     Reserved (zero)
   8       4     Segment count (big-endian u32)
   12      8     Total duration (big-endian f64, seconds)
   20      8     Index offset (big-endian u64, from start of file)
   28      8     Index size (big-endian u64)
   36      8     Payload offset (big-endian u64, from start of file)
-  40      8     Payload size (big-endian u64)
-  48      4     Source info size (big-endian u32)
-  52      4     Checksum type: 0=none, 1=CRC32, 2=SHA256
-  56      8     Header checksum (CRC32 of bytes 0-55, zero-padded)
+  44      8     Payload size (big-endian u64)
+  52      4     Source info size (big-endian u32)
+  56      4     Checksum type: 0=none, 1=CRC32, 2=SHA256
+  60      8     Header checksum (CRC32 of bytes 0-59, zero-padded)
 
 Source Info (variable length, JSON):
   Length-prefixed JSON blob containing source metadata
@@ -46,37 +47,250 @@ Segment Index (variable length):
     64      8     Payload offset (big-endian u64, relative to payload section)
     72      8     Payload size (big-endian u64)
 
+Compact Segment Index (flags bit 2, replaces the fixed entries above):
+  Columnar layout for N segments; used when every CRF fits in a byte and
+  there are at most 256 distinct encoder IDs.
+    Size    Field
+    ----    -----
+    4       Encoder table size (big-endian u32)
+    var     Encoder table (JSON array of encoder IDs)
+    N*8     Start times (big-endian f64)
+    N*8     End times (big-endian f64)
+    N*8     VMAF scores (big-endian f64, -1 if unavailable)
+    N*8     PSNR scores (big-endian f64, -1 if unavailable)
+    N*8     SSIM scores (big-endian f64, -1 if unavailable)
+    N       CRF values (u8)
+    N       Encoder table indices (u8)
+    var     Segment IDs (zigzag LEB128 varint, delta from previous)
+    var     Payload offsets (zigzag LEB128 varint, delta from previous)
+    var     Payload sizes (LEB128 varint)
+
 Payload Section:
   Concatenated segment video data
 """
 
+import bisect
 import hashlib
 import json
+import mmap
+import os
 import struct
+import sys
 import zlib
+from collections.abc import MutableSequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional, BinaryIO, Tuple
+from typing import Dict, List, Any, Optional, BinaryIO, ClassVar, Iterable, Iterator, Tuple
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
 
 
 # Container magic and version
 RWV_VIDEO_MAGIC = b'RWVV'
 RWV_VIDEO_VERSION = 1
 
+# Precompiled layouts (see format specification above)
+_HEADER_STRUCT = struct.Struct(">4s B B 2s I d Q Q Q Q I I")
+_SEGMENT_ENTRY_STRUCT = struct.Struct(">I d d 16s I d d d Q Q")
+
 # Header constants
-HEADER_SIZE = 64
-SEGMENT_INDEX_ENTRY_SIZE = 80
+HEADER_CHECKSUM_SIZE = 8
+HEADER_SIZE = _HEADER_STRUCT.size + HEADER_CHECKSUM_SIZE
+SEGMENT_INDEX_ENTRY_SIZE = _SEGMENT_ENTRY_STRUCT.size
 ENCODER_ID_SIZE = 16
 
 # Flags
 FLAG_HAS_CHECKSUM = 0x01
 FLAG_COMPRESSED_INDEX = 0x02
+FLAG_COMPACT_INDEX = 0x04
 
 # Checksum types
 CHECKSUM_NONE = 0
 CHECKSUM_CRC32 = 1
 CHECKSUM_SHA256 = 2
 
+# Encoder ID <-> fixed 16-byte slot caches. Real containers use a handful
+# of encoder IDs, so these stay tiny; the cap only guards odd inputs.
+_ENCODER_ID_CACHE_MAX = 256
+_ENCODER_SLOT_CACHE: Dict[str, bytes] = {}
+_ENCODER_ID_CACHE: Dict[bytes, str] = {}
+
+# Output buffer size for container writes
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# os.sendfile only accepts regular-file destinations on Linux
+_HAS_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+
+# JSONL index lines are parsed straight from bytes; orjson is used when
+# installed. Writers stay on the stdlib encoder so output is byte-stable.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Serialized form of an empty source_info, the common case for pipelines
+_EMPTY_SOURCE_JSON = b'{}'
+
+
+def _decode_source_info(source_json: bytes) -> Dict[str, Any]:
+    """Parse a source info blob, skipping the parser when it is empty."""
+    if source_json in (b'', _EMPTY_SOURCE_JSON):
+        return {}
+    return _json_loads(source_json)
+
+
+def _open_preallocated(path: str, size: int) -> BinaryIO:
+    """
+    Open path for writing with its final size reserved up front.
+
+    Reserving the whole file lets the filesystem lay it out in as few
+    extents as possible. Filesystems without fallocate support just
+    skip the reservation.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        if size and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except OSError:
+                pass
+        return os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned integer as LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read a LEB128 varint at pos, returning (value, new_pos)."""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _append_delta_varints(out: bytearray, values) -> None:
+    """Append values as zigzag varint deltas from the previous value."""
+    prev = 0
+    for value in values:
+        delta = value - prev
+        _append_varint(out, delta << 1 if delta >= 0 else (-delta << 1) - 1)
+        prev = value
+
+
+def _read_delta_varints(data: bytes, pos: int, count: int) -> Tuple[List[int], int]:
+    """Read count zigzag varint deltas, returning (values, new_pos)."""
+    values = []
+    prev = 0
+    for _ in range(count):
+        zz, pos = _read_varint(data, pos)
+        prev += (zz >> 1) ^ -(zz & 1)
+        values.append(prev)
+    return values, pos
+
+
+def _encode_compact_index(rows: List[Tuple]) -> Optional[bytes]:
+    """
+    Encode index rows in the compact columnar layout.
+
+    Returns None when the rows don't fit it (CRF outside 0-255 or more
+    than 256 encoder IDs); callers then use the fixed-size layout.
+    """
+    count = len(rows)
+    slots: Dict[bytes, int] = {}
+    crfs = bytearray(count)
+    encoder_indices = bytearray(count)
+    for i, row in enumerate(rows):
+        encoder_index = slots.setdefault(row[3], len(slots))
+        crf = row[4]
+        if encoder_index > 0xFF or not 0 <= crf <= 0xFF:
+            return None
+        crfs[i] = crf
+        encoder_indices[i] = encoder_index
+
+    columns = list(zip(*rows)) if rows else [()] * 10
+    table = json.dumps([_encoder_id_from_slot(slot) for slot in slots],
+                       separators=(',', ':')).encode('utf-8')
+    f64_column = struct.Struct(f">{count}d")
+
+    out = bytearray(struct.pack(">I", len(table)))
+    out += table
+    for column in (1, 2, 5, 6, 7):  # start, end, vmaf, psnr, ssim
+        out += f64_column.pack(*columns[column])
+    out += crfs
+    out += encoder_indices
+    _append_delta_varints(out, columns[0])
+    _append_delta_varints(out, columns[8])
+    for size in columns[9]:
+        _append_varint(out, size)
+    return bytes(out)
+
+
+def _decode_compact_index(data: bytes, count: int) -> List[Tuple]:
+    """Decode a compact columnar index into fixed-layout index rows."""
+    (table_size,) = struct.unpack_from(">I", data, 0)
+    pos = 4 + table_size
+    table = [_encoder_id_to_slot(e) for e in json.loads(data[4:pos])]
+
+    f64_column = struct.Struct(f">{count}d")
+    columns = []
+    for _ in range(5):
+        columns.append(f64_column.unpack_from(data, pos))
+        pos += f64_column.size
+    starts, ends, vmafs, psnrs, ssims = columns
+
+    crfs = data[pos:pos + count]
+    encoder_indices = data[pos + count:pos + 2 * count]
+    pos += 2 * count
+    if max(encoder_indices, default=0) >= len(table):
+        raise ValueError("Encoder index out of range")
+
+    segment_ids, pos = _read_delta_varints(data, pos, count)
+    payload_offsets, pos = _read_delta_varints(data, pos, count)
+    payload_sizes = []
+    for _ in range(count):
+        size, pos = _read_varint(data, pos)
+        payload_sizes.append(size)
+
+    return list(zip(
+        segment_ids, starts, ends, [table[i] for i in encoder_indices],
+        crfs, vmafs, psnrs, ssims, payload_offsets, payload_sizes,
+    ))
+
+
+def _encoder_id_to_slot(encoder_id: str) -> bytes:
+    """Encode an encoder ID into its null-padded 16-byte index slot."""
+    slot = _ENCODER_SLOT_CACHE.get(encoder_id)
+    if slot is None:
+        slot = encoder_id.encode('utf-8')[:ENCODER_ID_SIZE].ljust(ENCODER_ID_SIZE, b'\x00')
+        if len(_ENCODER_SLOT_CACHE) < _ENCODER_ID_CACHE_MAX:
+            _ENCODER_SLOT_CACHE[encoder_id] = slot
+    return slot
+
+
+def _encoder_id_from_slot(slot: bytes) -> str:
+    """Decode a null-padded 16-byte index slot back into an encoder ID."""
+    encoder_id = _ENCODER_ID_CACHE.get(slot)
+    if encoder_id is None:
+        encoder_id = slot.rstrip(b'\x00').decode('utf-8')
+        if len(_ENCODER_ID_CACHE) < _ENCODER_ID_CACHE_MAX:
+            _ENCODER_ID_CACHE[slot] = encoder_id
+    return encoder_id
+
 
 @dataclass
 class SegmentRecord:
@@ -101,6 +315,10 @@ class SegmentRecord:
     payload_offset: int
     payload_size: int
 
+    # Reassignments of lookup fields on any existing record, so containers
+    # know when their lookup indexes may be stale
+    _key_edits: ClassVar[int] = 0
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "segment_id": self.segment_id,
@@ -127,6 +345,195 @@ class SegmentRecord:
         )
 
 
+class _LookupField:
+    """
+    SegmentRecord field the container's lookup indexes are keyed on.
+
+    Only assignment is intercepted, to count edits of existing records;
+    without __get__, reads go straight to the instance dict.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set__(self, record: SegmentRecord, value: Any) -> None:
+        fields = record.__dict__
+        if self.name in fields:
+            SegmentRecord._key_edits += 1
+        fields[self.name] = value
+
+
+for _name in ("segment_id", "start_time", "end_time"):
+    setattr(SegmentRecord, _name, _LookupField(_name))
+del _name
+
+
+def _segment_record_from_row(row: Tuple) -> SegmentRecord:
+    """Build a SegmentRecord from an unpacked segment index entry."""
+    (
+        segment_id, start_time, end_time, encoder_id_bytes,
+        crf, vmaf, psnr, ssim, payload_offset, payload_size
+    ) = row
+
+    encoder_id = _encoder_id_from_slot(encoder_id_bytes)
+
+    # Convert -1 back to None for unavailable metrics
+    metrics = {}
+    if vmaf >= 0:
+        metrics['vmaf'] = vmaf
+    if psnr >= 0:
+        metrics['psnr'] = psnr
+    if ssim >= 0:
+        metrics['ssim'] = ssim
+
+    return SegmentRecord(
+        segment_id=segment_id,
+        start_time=start_time,
+        end_time=end_time,
+        chosen_encoder_id=encoder_id,
+        encoder_parameters={'crf': crf},
+        perceptual_metrics=metrics,
+        payload_offset=payload_offset,
+        payload_size=payload_size,
+    )
+
+
+class _SegmentList(MutableSequence):
+    """
+    Segment list that counts changes to its contents.
+
+    VideoContainer compares ``changes`` with the count its lookup indexes
+    were built at, so segments assigned, inserted or removed directly are
+    re-indexed before the next lookup.
+    """
+
+    def __init__(self, records: Iterable[SegmentRecord] = ()):
+        self._records: List[SegmentRecord] = list(records)
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, i):
+        return self._records[i]
+
+    def __iter__(self) -> Iterator[SegmentRecord]:
+        return iter(self._records)
+
+    def __setitem__(self, i, record) -> None:
+        self._records[i] = record
+        self.changes += 1
+
+    def __delitem__(self, i) -> None:
+        del self._records[i]
+        self.changes += 1
+
+    def insert(self, i: int, record: SegmentRecord) -> None:
+        self._records.insert(i, record)
+        self.changes += 1
+
+    def append(self, record: SegmentRecord) -> None:
+        self._records.append(record)
+        self.changes += 1
+
+    def index_rows(self, encode) -> Iterator[Tuple]:
+        """Yield the index row of every record."""
+        return map(encode, self._records)
+
+    def lookup_keys(self) -> Iterator[Tuple[int, float, float]]:
+        """Yield (segment_id, start_time, end_time) per position."""
+        return ((r.segment_id, r.start_time, r.end_time) for r in self._records)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _LazySegmentList(_SegmentList):
+    """
+    Segment list backed by unpacked index rows.
+
+    A SegmentRecord is only built the first time its position is
+    accessed; random-access readers never pay for the rest. Records
+    assigned or inserted directly are stored as-is.
+    """
+
+    def __init__(self, rows: List[Tuple]):
+        self._rows: List[Optional[Tuple]] = rows
+        self._records: List[Optional[SegmentRecord]] = [None] * len(rows)
+        self.changes = 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        record = self._records[i]
+        if record is None:
+            record = self._records[i] = _segment_record_from_row(self._rows[i])
+        return record
+
+    def __iter__(self) -> Iterator[SegmentRecord]:
+        for i in range(len(self._records)):
+            yield self[i]
+
+    def __setitem__(self, i, record) -> None:
+        if isinstance(i, slice):
+            record = list(record)
+            self._rows[i] = [None] * len(record)
+        else:
+            self._rows[i] = None
+        self._records[i] = record
+        self.changes += 1
+
+    def __delitem__(self, i) -> None:
+        del self._rows[i]
+        del self._records[i]
+        self.changes += 1
+
+    def insert(self, i: int, record: SegmentRecord) -> None:
+        self._rows.insert(i, None)
+        self._records.insert(i, record)
+        self.changes += 1
+
+    def append(self, record: SegmentRecord) -> None:
+        self._rows.append(None)
+        self._records.append(record)
+        self.changes += 1
+
+    def index_rows(self, encode) -> Iterator[Tuple]:
+        """Yield index rows, encoding only records that were materialized."""
+        for row, record in zip(self._rows, self._records):
+            yield row if record is None else encode(record)
+
+    def lookup_keys(self) -> Iterator[Tuple[int, float, float]]:
+        """Yield (segment_id, start_time, end_time) per position without decoding."""
+        for row, record in zip(self._rows, self._records):
+            if record is not None:
+                yield record.segment_id, record.start_time, record.end_time
+            else:
+                yield row[0], row[1], row[2]
+
+
+@dataclass
+class _FilePayload:
+    """Segment payload left on disk until the container is written."""
+    path: str
+    size: int
+
+    def read_range(self, offset: int, size: int) -> bytes:
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return f.read(max(0, min(size, self.size - offset)))
+
+    def iter_blocks(self, block_size: int) -> Iterator[bytes]:
+        with open(self.path, 'rb') as f:
+            remaining = self.size
+            while remaining:
+                block = f.read(min(remaining, block_size))
+                if not block:
+                    break
+                yield block
+                remaining -= len(block)
+
+
 @dataclass
 class ContainerHeader:
     """Header for RWV-VIDEO-V1 container."""
@@ -153,7 +560,7 @@ class VideoContainer:
     RWV-VIDEO-V1 container reader/writer.
 
     Implements the stable binary format for production use:
-    - Fixed 64-byte header with checksums
+    - Fixed 68-byte header with checksums
     - Fixed-size segment index entries (80 bytes each)
     - Concatenated payload blob
 
@@ -165,95 +572,232 @@ class VideoContainer:
 
     def __init__(self):
         self.header: Optional[ContainerHeader] = None
-        self.segments: List[SegmentRecord] = []
-        self._payload_data: bytes = b''
+        self._segments: _SegmentList = _SegmentList()
+        # Payload section as appended chunks (bytes or _FilePayload),
+        # so adding segments never copies the payload accumulated so far
+        self._payload_chunks: List[Any] = []
+        # Payload offset at which each chunk starts
+        self._chunk_starts: List[int] = []
+        self._payload_size: int = 0
+        # Latest segment end time, maintained as segments are added
+        self._max_end_time: float = 0.0
+        # Read-only mapping backing the payload of a container read from disk
+        self._mmap: Optional[mmap.mmap] = None
+        self._mmap_path: Optional[str] = None
         self._source_info: Dict[str, Any] = {}
         self._use_checksum: bool = True
         self._checksum_type: int = CHECKSUM_CRC32
+        # Lookup indexes over positions in self.segments: segment_id ->
+        # position, and the start time at each position. While segments
+        # run in time order without overlapping, get_segment_by_time can
+        # bisect the start times; otherwise it scans like the original.
+        self._by_id: Dict[int, int] = {}
+        self._starts: List[float] = []
+        self._time_ordered: bool = True
+        # _lookup_stamp() as of the last indexing; a mismatch means the
+        # segments changed other than through add_segment
+        self._lookup_at: Optional[Tuple[int, int]] = self._lookup_stamp()
+
+    @property
+    def segments(self) -> MutableSequence:
+        """Segment records, in container order."""
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments: Iterable[SegmentRecord]) -> None:
+        if not isinstance(segments, _SegmentList):
+            segments = _SegmentList(segments)
+        self._segments = segments
+        self._lookup_at = None
+
+    def _set_payload(self, data: bytes) -> None:
+        """Replace the payload section with one buffer."""
+        self._payload_chunks = [data] if data else []
+        self._chunk_starts = [0] if data else []
+        self._payload_size = len(data)
+
+    def _read_payload(self, start: int, size: int) -> bytes:
+        """
+        Read size bytes of payload at offset start.
+
+        Only the chunks holding that range are touched, so a file-backed
+        chunk is read from disk just for the bytes requested.
+        """
+        chunk_starts = self._chunk_starts
+        first = bisect.bisect_right(chunk_starts, start) - 1
+        if first < 0 or size <= 0:
+            return b''
+        parts = []
+        for i in range(first, len(self._payload_chunks)):
+            chunk = self._payload_chunks[i]
+            offset = start - chunk_starts[i]
+            if isinstance(chunk, _FilePayload):
+                part = chunk.read_range(offset, size)
+            else:
+                part = bytes(chunk[offset:offset + size])
+            parts.append(part)
+            start += len(part)
+            size -= len(part)
+            if size <= 0:
+                break
+        return parts[0] if len(parts) == 1 else b''.join(parts)
+
+    def _detach_mapping(self, path: str) -> None:
+        """Copy the payload out of the mapping before path is overwritten."""
+        if self._mmap_path is None or not os.path.exists(path):
+            return
+        if os.path.samefile(path, self._mmap_path):
+            self._payload_chunks = [
+                bytes(c) if isinstance(c, memoryview) else c
+                for c in self._payload_chunks
+            ]
+            self._mmap = None
+            self._mmap_path = None
 
     def add_segment(self, record: SegmentRecord, payload: bytes) -> None:
         """Add a segment to the container."""
         # Update offset to current position in payload
-        record.payload_offset = len(self._payload_data)
+        record.payload_offset = self._payload_size
         record.payload_size = len(payload)
-        self.segments.append(record)
-        self._payload_data += payload
+        self._append_segment(record)
+        self._payload_chunks.append(payload)
+        self._chunk_starts.append(self._payload_size)
+        self._payload_size += len(payload)
+
+    def add_segment_from_path(self, record: SegmentRecord, src_path: str) -> None:
+        """
+        Add a segment whose payload is an encoded file on disk.
+
+        The file is not read into memory; it is copied into the container
+        when it is written (via os.sendfile on Linux).
+        """
+        size = os.path.getsize(src_path)
+        record.payload_offset = self._payload_size
+        record.payload_size = size
+        self._append_segment(record)
+        self._payload_chunks.append(_FilePayload(str(src_path), size))
+        self._chunk_starts.append(self._payload_size)
+        self._payload_size += size
+
+    def _append_segment(self, record: SegmentRecord) -> None:
+        """
+        Append record to self.segments and to the lookup indexes.
+
+        If the indexes were already stale they are left for the next
+        lookup to rebuild.
+        """
+        indexed = self._lookup_at == self._lookup_stamp()
+        self._segments.append(record)
+        if indexed:
+            self._index_key(record.segment_id, record.start_time, record.end_time,
+                            len(self._segments) - 1)
+            self._lookup_at = self._lookup_stamp()
+
+    def _index_key(self, segment_id: int, start_time: float, end_time: float,
+                   pos: int) -> None:
+        # First record wins on duplicate IDs, matching scan order
+        self._by_id.setdefault(segment_id, pos)
+        if self._starts and (start_time < self._starts[-1]
+                             or start_time < self._max_end_time):
+            # Out of order or overlapping an earlier segment
+            self._time_ordered = False
+        self._starts.append(start_time)
+        if end_time > self._max_end_time:
+            self._max_end_time = end_time
+
+    def _rebuild_lookup(self) -> None:
+        """Rebuild the lookup indexes from self.segments."""
+        self._by_id = {}
+        self._starts = []
+        self._time_ordered = True
+        self._max_end_time = 0.0
+        for pos, (segment_id, start_time, end_time) in enumerate(self._segments.lookup_keys()):
+            self._index_key(segment_id, start_time, end_time, pos)
+        self._lookup_at = self._lookup_stamp()
+
+    def _lookup_stamp(self) -> Tuple[int, int]:
+        """Change counts of the segment list and of record lookup fields."""
+        return self._segments.changes, SegmentRecord._key_edits
+
+    def _sync_lookup(self) -> None:
+        """Re-index segments changed other than through add_segment."""
+        if self._lookup_at != self._lookup_stamp():
+            self._rebuild_lookup()
 
     def _encode_segment_index_entry(self, segment: SegmentRecord) -> bytes:
         """Encode a segment record to fixed-size binary format (80 bytes)."""
+        return _SEGMENT_ENTRY_STRUCT.pack(*self._segment_index_row(segment))
+
+    def _index_rows(self) -> Iterator[Tuple]:
+        """Yield the index row for every segment, in order."""
+        # A lazily read list reuses rows never materialized as read
+        return self._segments.index_rows(self._segment_index_row)
+
+    def _pack_segment_index(self, buf: bytearray, offset: int) -> None:
+        """Encode the whole segment index into buf starting at offset."""
+        pack_into = _SEGMENT_ENTRY_STRUCT.pack_into
+        for row in self._index_rows():
+            pack_into(buf, offset, *row)
+            offset += SEGMENT_INDEX_ENTRY_SIZE
+
+    @staticmethod
+    def _segment_index_row(segment: SegmentRecord) -> Tuple:
+        """Field values of a segment index entry, in on-disk order."""
         # Encode encoder ID as fixed 16-byte string
-        encoder_id_bytes = segment.chosen_encoder_id.encode('utf-8')[:ENCODER_ID_SIZE]
-        encoder_id_bytes = encoder_id_bytes.ljust(ENCODER_ID_SIZE, b'\x00')
+        encoder_id_bytes = _encoder_id_to_slot(segment.chosen_encoder_id)
 
         # Extract CRF from encoder parameters (default 23)
         crf = segment.encoder_parameters.get('crf', 23)
 
-        # Get metrics, use -1 for unavailable
-        vmaf = segment.perceptual_metrics.get('vmaf', -1.0)
-        psnr = segment.perceptual_metrics.get('psnr', -1.0)
-        ssim = segment.perceptual_metrics.get('ssim', -1.0)
-
-        if vmaf is None:
-            vmaf = -1.0
-        if psnr is None:
-            psnr = -1.0
-        if ssim is None:
-            ssim = -1.0
+        # Get metrics, use -1 for unavailable (missing or explicit None)
+        metrics = segment.perceptual_metrics
+        vmaf = metrics.get('vmaf')
+        psnr = metrics.get('psnr')
+        ssim = metrics.get('ssim')
 
-        return struct.pack(
-            ">I d d 16s I d d d Q Q",
+        return (
             segment.segment_id,          # 4 bytes
             segment.start_time,          # 8 bytes
             segment.end_time,            # 8 bytes
             encoder_id_bytes,            # 16 bytes
             crf,                         # 4 bytes
-            vmaf,                        # 8 bytes
-            psnr,                        # 8 bytes
-            ssim,                        # 8 bytes
+            -1.0 if vmaf is None else vmaf,  # 8 bytes
+            -1.0 if psnr is None else psnr,  # 8 bytes
+            -1.0 if ssim is None else ssim,  # 8 bytes
             segment.payload_offset,      # 8 bytes
             segment.payload_size,        # 8 bytes
         )
 
-    def _decode_segment_index_entry(self, data: bytes) -> SegmentRecord:
-        """Decode a segment record from fixed-size binary format."""
-        (
-            segment_id, start_time, end_time, encoder_id_bytes,
-            crf, vmaf, psnr, ssim, payload_offset, payload_size
-        ) = struct.unpack(">I d d 16s I d d d Q Q", data)
-
-        encoder_id = encoder_id_bytes.rstrip(b'\x00').decode('utf-8')
-
-        # Convert -1 back to None for unavailable metrics
-        metrics = {}
-        if vmaf >= 0:
-            metrics['vmaf'] = vmaf
-        if psnr >= 0:
-            metrics['psnr'] = psnr
-        if ssim >= 0:
-            metrics['ssim'] = ssim
-
-        return SegmentRecord(
-            segment_id=segment_id,
-            start_time=start_time,
-            end_time=end_time,
-            chosen_encoder_id=encoder_id,
-            encoder_parameters={'crf': crf},
-            perceptual_metrics=metrics,
-            payload_offset=payload_offset,
-            payload_size=payload_size,
-        )
+    def _decode_segment_index_entry(self, data: bytes, offset: int = 0) -> SegmentRecord:
+        """Decode a segment record from fixed-size binary format at offset."""
+        return _segment_record_from_row(_SEGMENT_ENTRY_STRUCT.unpack_from(data, offset))
 
     def _compute_checksum(self, data: bytes, checksum_type: int) -> bytes:
         """Compute checksum for data."""
         if checksum_type == CHECKSUM_CRC32:
-            crc = zlib.crc32(data) & 0xFFFFFFFF
-            return struct.pack(">Q", crc)
+            return (zlib.crc32(data) & 0xFFFFFFFF).to_bytes(HEADER_CHECKSUM_SIZE, 'big')
         elif checksum_type == CHECKSUM_SHA256:
             return hashlib.sha256(data).digest()[:8]
         return b'\x00' * 8
 
+    def payload_sha256(self) -> bytes:
+        """
+        Full 32-byte SHA-256 digest of the payload section.
+
+        Hashes chunk by chunk (file-backed payloads in blocks), so the
+        payload is never joined into one buffer.
+        """
+        h = hashlib.sha256()
+        for chunk in self._payload_chunks:
+            if isinstance(chunk, _FilePayload):
+                for block in chunk.iter_blocks(_WRITE_BUFFER_SIZE):
+                    h.update(block)
+            else:
+                h.update(chunk)
+        return h.digest()
+
     def write(self, path: str, source_info: Optional[Dict[str, Any]] = None,
-              use_checksum: bool = True) -> None:
+              use_checksum: bool = True, compact_index: bool = False) -> None:
         """
         Write container to file using stable binary format.
 
@@ -261,16 +805,21 @@ class VideoContainer:
             path: Output file path
             source_info: Optional metadata dictionary
             use_checksum: Whether to include CRC32 checksums
+            compact_index: Store the segment index in the compact columnar
+                layout when the segments allow it
         """
-        source_info = source_info or {}
-        source_json = json.dumps(source_info, separators=(',', ':')).encode('utf-8')
+        if source_info:
+            source_json = json.dumps(source_info, separators=(',', ':')).encode('utf-8')
+        else:
+            source_json = _EMPTY_SOURCE_JSON
+        self._detach_mapping(path)
 
-        total_duration = 0.0
-        if self.segments:
-            total_duration = max(s.end_time for s in self.segments)
+        # Re-index first so directly appended segments are counted
+        self._sync_lookup()
+        total_duration = self._max_end_time
 
         # Calculate offsets
-        # Header: 64 bytes
+        # Header: 68 bytes
         # Source info: 4 bytes length + data
         # Index: segment_count * 80 bytes
         # Payload: variable
@@ -278,20 +827,30 @@ class VideoContainer:
         source_info_start = HEADER_SIZE
         source_info_size = len(source_json)
         index_offset = source_info_start + 4 + source_info_size
-        index_size = len(self.segments) * SEGMENT_INDEX_ENTRY_SIZE
+        compact_data = None
+        if compact_index:
+            compact_data = _encode_compact_index(list(self._index_rows()))
+        if compact_data is not None:
+            index_size = len(compact_data)
+        else:
+            index_size = len(self.segments) * SEGMENT_INDEX_ENTRY_SIZE
         payload_offset = index_offset + index_size
-        payload_size = len(self._payload_data)
+        payload_size = self._payload_size
 
         flags = 0
         checksum_type = CHECKSUM_NONE
         if use_checksum:
             flags |= FLAG_HAS_CHECKSUM
             checksum_type = CHECKSUM_CRC32
-
-        with open(path, 'wb') as f:
-            # Build header (without checksum field first)
-            header_data = struct.pack(
-                ">4s B B 2s I d Q Q Q Q I I",
+        if compact_data is not None:
+            flags |= FLAG_COMPACT_INDEX
+
+        with _open_preallocated(path, payload_offset + payload_size) as f:
+            # Assemble header, checksum, source info (length-prefixed)
+            # and segment index in one buffer and write it at once
+            prefix = bytearray(payload_offset)
+            _HEADER_STRUCT.pack_into(
+                prefix, 0,
                 RWV_VIDEO_MAGIC,           # 4 bytes: Magic
                 RWV_VIDEO_VERSION,         # 1 byte: Version
                 flags,                     # 1 byte: Flags
@@ -306,23 +865,52 @@ class VideoContainer:
                 checksum_type,             # 4 bytes: Checksum type
             )
 
-            # Compute header checksum
-            header_checksum = self._compute_checksum(header_data, checksum_type)
-
-            # Write header + checksum
-            f.write(header_data)
-            f.write(header_checksum)
-
-            # Write source info (length-prefixed)
-            f.write(struct.pack(">I", source_info_size))
-            f.write(source_json)
+            # Header checksum goes straight into its slot; CHECKSUM_NONE
+            # leaves the zero-filled slot as is
+            if checksum_type != CHECKSUM_NONE:
+                prefix[_HEADER_STRUCT.size:HEADER_SIZE] = self._compute_checksum(
+                    memoryview(prefix)[:_HEADER_STRUCT.size], checksum_type)
 
-            # Write segment index
-            for segment in self.segments:
-                f.write(self._encode_segment_index_entry(segment))
+            struct.pack_into(">I", prefix, source_info_start, source_info_size)
+            prefix[source_info_start + 4:index_offset] = source_json
+            if compact_data is not None:
+                prefix[index_offset:payload_offset] = compact_data
+            else:
+                self._pack_segment_index(prefix, index_offset)
+            f.write(prefix)
 
             # Write payload
-            f.write(self._payload_data)
+            self._write_payload(f)
+
+    def _write_payload(self, f: BinaryIO) -> None:
+        """Write the payload section chunk by chunk."""
+        for chunk in self._payload_chunks:
+            if isinstance(chunk, _FilePayload):
+                self._copy_file_payload(f, chunk)
+            else:
+                f.write(chunk)
+
+    @staticmethod
+    def _copy_file_payload(f: BinaryIO, chunk: _FilePayload) -> None:
+        """Copy a file-backed payload chunk into the output stream."""
+        sent = 0
+        if _HAS_SENDFILE:
+            # Kernel-side copy; resync the buffered writer afterwards
+            with open(chunk.path, 'rb') as src:
+                f.flush()
+                start = f.tell()
+                while sent < chunk.size:
+                    n = os.sendfile(f.fileno(), src.fileno(), sent, chunk.size - sent)
+                    if n == 0:
+                        break
+                    sent += n
+                f.seek(start + sent)
+        else:
+            for block in chunk.iter_blocks(_WRITE_BUFFER_SIZE):
+                f.write(block)
+                sent += len(block)
+        if sent != chunk.size:
+            raise ValueError(f"Payload file changed size: {chunk.path}")
 
     def write_legacy(self, path: str, source_info: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -330,25 +918,36 @@ class VideoContainer:
 
         This method is provided for compatibility with older readers.
         """
-        index_lines = [json.dumps(s.to_dict()) for s in self.segments]
-        index_data = '\n'.join(index_lines).encode('utf-8')
+        self._detach_mapping(path)
+        index_data = b'\n'.join(
+            json.dumps(s.to_dict()).encode('utf-8') for s in self.segments
+        )
 
-        with open(path, 'wb') as f:
+        with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(RWV_VIDEO_MAGIC)
             f.write(bytes([RWV_VIDEO_VERSION]))
             f.write(bytes([0, 0, 0]))
             f.write(struct.pack(">I", len(self.segments)))
             f.write(struct.pack(">Q", len(index_data)))
-            source_json = json.dumps(source_info or {}).encode('utf-8')
+            if source_info:
+                source_json = json.dumps(source_info).encode('utf-8')
+            else:
+                source_json = _EMPTY_SOURCE_JSON
             f.write(struct.pack(">I", len(source_json)))
             f.write(source_json)
             f.write(index_data)
-            f.write(self._payload_data)
+            self._write_payload(f)
 
     @classmethod
-    def read(cls, path: str) -> 'VideoContainer':
+    def read(cls, path: str, prefetch: bool = False) -> 'VideoContainer':
         """
         Read container from file (auto-detects format version).
+
+        Args:
+            path: Container file path
+            prefetch: Ask the kernel to start reading the whole file
+                asynchronously up front. Worth it for cold loads of large
+                containers that will be read mostly in full.
         """
         container = cls()
 
@@ -373,7 +972,7 @@ class VideoContainer:
             # Try to detect format by checking structure
             if len(header_bytes) >= HEADER_SIZE:
                 try:
-                    return cls._read_binary_format(path)
+                    return cls._read_binary_format(path, prefetch=prefetch)
                 except (struct.error, ValueError):
                     # Fall back to legacy format
                     pass
@@ -382,7 +981,7 @@ class VideoContainer:
             return cls._read_legacy_format(path)
 
     @classmethod
-    def _read_binary_format(cls, path: str) -> 'VideoContainer':
+    def _read_binary_format(cls, path: str, prefetch: bool = False) -> 'VideoContainer':
         """Read container using stable binary format."""
         container = cls()
 
@@ -397,9 +996,9 @@ class VideoContainer:
                 total_duration, index_offset, index_size,
                 payload_offset, payload_size, source_info_size,
                 checksum_type
-            ) = struct.unpack(">4s B B 2s I d Q Q Q Q I I", header_bytes[:56])
+            ) = _HEADER_STRUCT.unpack_from(header_bytes)
 
-            header_checksum = header_bytes[56:64]
+            header_checksum = header_bytes[_HEADER_STRUCT.size:HEADER_SIZE]
 
             if magic != RWV_VIDEO_MAGIC:
                 raise ValueError(f"Invalid magic: {magic!r}")
@@ -409,29 +1008,50 @@ class VideoContainer:
 
             # Verify checksum if present
             if flags & FLAG_HAS_CHECKSUM:
-                expected_checksum = container._compute_checksum(header_bytes[:56], checksum_type)
+                expected_checksum = container._compute_checksum(
+                    header_bytes[:_HEADER_STRUCT.size], checksum_type)
                 if header_checksum != expected_checksum:
                     raise ValueError("Header checksum mismatch")
 
+            # Queue readahead of everything past the header so index and
+            # payload reads are serviced concurrently by the device
+            if prefetch and hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), HEADER_SIZE, 0, os.POSIX_FADV_WILLNEED)
+
             # Read source info
             f.seek(HEADER_SIZE)
             source_info_len = struct.unpack(">I", f.read(4))[0]
-            source_json = f.read(source_info_len).decode('utf-8')
-            source_info = json.loads(source_json) if source_json else {}
+            source_info = _decode_source_info(f.read(source_info_len))
             container._source_info = source_info
 
-            # Read segment index
+            # Read segment index in one read; records are built lazily
             f.seek(index_offset)
-            for _ in range(segment_count):
-                entry_data = f.read(SEGMENT_INDEX_ENTRY_SIZE)
-                if len(entry_data) < SEGMENT_INDEX_ENTRY_SIZE:
+            if flags & FLAG_COMPACT_INDEX:
+                index_data = f.read(index_size)
+                if len(index_data) < index_size:
                     raise ValueError("Truncated segment index")
-                record = container._decode_segment_index_entry(entry_data)
-                container.segments.append(record)
-
-            # Read payload
-            f.seek(payload_offset)
-            container._payload_data = f.read(payload_size)
+                rows = _decode_compact_index(index_data, segment_count)
+            else:
+                index_length = segment_count * SEGMENT_INDEX_ENTRY_SIZE
+                index_data = f.read(index_length)
+                if len(index_data) < index_length:
+                    raise ValueError("Truncated segment index")
+                rows = list(_SEGMENT_ENTRY_STRUCT.iter_unpack(index_data))
+            container.segments = _LazySegmentList(rows)
+
+            # Map the payload rather than reading it; pages are faulted in
+            # only for segments that are actually accessed
+            if payload_size:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                advice = 'MADV_WILLNEED' if prefetch else 'MADV_RANDOM'
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+                container._mmap = mm
+                container._mmap_path = path
+                container._set_payload(memoryview(mm)[
+                    payload_offset:payload_offset + payload_size])
+
+            container._rebuild_lookup()
 
             # Build header object
             container.header = ContainerHeader(
@@ -465,26 +1085,22 @@ class VideoContainer:
             index_length = struct.unpack(">Q", f.read(8))[0]
 
             source_json_len = struct.unpack(">I", f.read(4))[0]
-            source_json = f.read(source_json_len).decode('utf-8')
-            source_info = json.loads(source_json) if source_json else {}
+            source_info = _decode_source_info(f.read(source_json_len))
             container._source_info = source_info
 
-            index_data = f.read(index_length).decode('utf-8')
-            for line in index_data.split('\n'):
+            index_data = f.read(index_length)
+            for line in index_data.splitlines():
                 if line.strip():
-                    record = SegmentRecord.from_dict(json.loads(line))
+                    record = SegmentRecord.from_dict(_json_loads(line))
                     container.segments.append(record)
 
-            container._payload_data = f.read()
-
-            total_duration = 0.0
-            if container.segments:
-                total_duration = max(s.end_time for s in container.segments)
+            container._set_payload(f.read())
+            container._rebuild_lookup()
 
             container.header = ContainerHeader(
                 version=version,
                 segment_count=len(container.segments),
-                total_duration=total_duration,
+                total_duration=container._max_end_time,
                 source_info=source_info,
                 index_offset=0,
                 payload_offset=0,
@@ -494,18 +1110,29 @@ class VideoContainer:
 
     def get_segment_payload(self, segment_id: int) -> Optional[bytes]:
         """Get payload data for a specific segment."""
-        for segment in self.segments:
-            if segment.segment_id == segment_id:
-                start = segment.payload_offset
-                end = start + segment.payload_size
-                return self._payload_data[start:end]
-        return None
+        self._sync_lookup()
+        pos = self._by_id.get(segment_id)
+        if pos is None:
+            return None
+        segment = self._segments[pos]
+        return self._read_payload(segment.payload_offset, segment.payload_size)
 
     def get_segment_by_time(self, timestamp: float) -> Optional[SegmentRecord]:
         """Get segment containing the given timestamp."""
-        for segment in self.segments:
-            if segment.start_time <= timestamp < segment.end_time:
-                return segment
+        self._sync_lookup()
+        if not self._time_ordered:
+            for segment in self._segments:
+                if segment.start_time <= timestamp < segment.end_time:
+                    return segment
+            return None
+        # Ordered and disjoint: only the last segment starting at or
+        # before timestamp can contain it
+        i = bisect.bisect_right(self._starts, timestamp) - 1
+        if i < 0:
+            return None
+        segment = self._segments[i]
+        if timestamp < segment.end_time:
+            return segment
         return None
 
     def extract_segment_to_file(self, segment_id: int, output_path: str) -> bool:
@@ -526,21 +1153,23 @@ class VideoContainer:
             errors.append(f"Segment count mismatch: header says {self.header.segment_count}, "
                          f"found {len(self.segments)}")
 
-        # Verify all segment payloads are accessible
-        total_payload_size = 0
-        for segment in self.segments:
-            if segment.payload_offset + segment.payload_size > len(self._payload_data):
+        # Single pass in payload order: bounds check each segment and
+        # compare it against its predecessor for overlap
+        segments = self.segments
+        if len(segments) > 1:
+            segments = sorted(segments, key=lambda s: s.payload_offset)
+        payload_size = self._payload_size
+        overlap_errors = []
+        prev = None
+        for segment in segments:
+            end = segment.payload_offset + segment.payload_size
+            if end > payload_size:
                 errors.append(f"Segment {segment.segment_id} payload extends beyond data")
-            total_payload_size += segment.payload_size
-
-        # Check for overlapping segments
-        sorted_segments = sorted(self.segments, key=lambda s: s.payload_offset)
-        for i in range(1, len(sorted_segments)):
-            prev = sorted_segments[i - 1]
-            curr = sorted_segments[i]
-            if prev.payload_offset + prev.payload_size > curr.payload_offset:
-                errors.append(f"Segments {prev.segment_id} and {curr.segment_id} "
-                             f"have overlapping payloads")
+            if prev is not None and prev_end > segment.payload_offset:
+                overlap_errors.append(f"Segments {prev.segment_id} and {segment.segment_id} "
+                                      f"have overlapping payloads")
+            prev, prev_end = segment, end
+        errors.extend(overlap_errors)
 
         return len(errors) == 0, errors
 
@@ -550,7 +1179,7 @@ class VideoContainer:
             "magic": RWV_VIDEO_MAGIC.decode('ascii'),
             "version": RWV_VIDEO_VERSION,
             "segment_count": len(self.segments),
-            "total_payload_size": len(self._payload_data),
+            "total_payload_size": self._payload_size,
             "total_duration": self.header.total_duration if self.header else 0,
             "source_info": self._source_info,
             "segments": [s.to_dict() for s in self.segments],
@@ -9,17 +9,32 @@ Full implementation with ffmpeg/gstreamer bindings for video processing,
 VMAF/PSNR/SSIM metric computation, scene detection, and motion-adaptive segmentation.
 """
 
+import bisect
+import functools
+import hashlib
 import json
+import math
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from fractions import Fraction
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+try:
+    import scenedetect
+except ImportError:  # pragma: no cover - depends on optional dependency
+    scenedetect = None
 
 from .types import (
     Segment,
@@ -32,6 +47,170 @@ from .types import (
 )
 
 
+# libvmaf writes its JSON log to stdout where that can be named as a file;
+# elsewhere only the pooled score ffmpeg logs is available
+_VMAF_LOG_OPTIONS = "=log_fmt=json:log_path=/dev/stdout" if os.name == "posix" else ""
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Options leading every ffmpeg command line; progress stats are never parsed
+_FFMPEG_GLOBAL_ARGS = ("-y", "-hide_banner", "-nostats")
+
+# Keyword arguments for every child process. Descriptors are not inherited
+# by default (PEP 446), so close_fds' fd-table sweep is skipped, which lets
+# CPython spawn through posix_spawn; stdin is closed so concurrent ffmpeg
+# runs never read the terminal.
+_SPAWN_OPTIONS: Dict[str, Any] = {"close_fds": False, "stdin": subprocess.DEVNULL}
+
+# Patterns for ffmpeg output, matched against raw bytes to skip decoding
+_PSNR_RE = re.compile(rb"PSNR.*average:(\d+\.?\d*)")
+_SSIM_RE = re.compile(rb"SSIM.*All:(\d+\.?\d*)")
+_VMAF_SCORE_RE = re.compile(rb"VMAF score: (\d+\.?\d*)")
+_PTS_RE = re.compile(rb"pts_time:(\d+\.?\d*)")
+_MPDECIMATE_RE = re.compile(rb"(keep|drop) pts:\S+ pts_time:(\d+\.?\d*)")
+
+# ffmpeg codec name and extra output arguments per encoder
+_ENCODER_CODECS: Dict[EncoderID, Tuple[str, List[str]]] = {
+    EncoderID.X264: ("libx264", []),
+    EncoderID.X265: ("libx265", ["-tag:v", "hvc1"]),
+    EncoderID.SVTAV1: ("libsvtav1", []),
+    EncoderID.VP9: ("libvpx-vp9", ["-row-mt", "1"]),
+    EncoderID.NVENC_H264: ("h264_nvenc", []),
+    EncoderID.NVENC_HEVC: ("hevc_nvenc", []),
+}
+
+
+# Encoders from fastest to slowest, for trying a cheap encode first
+_ENCODER_SPEED_ORDER: Dict[EncoderID, int] = {
+    EncoderID.NVENC_H264: 0,
+    EncoderID.NVENC_HEVC: 1,
+    EncoderID.X264: 2,
+    EncoderID.X265: 3,
+    EncoderID.VP9: 4,
+    EncoderID.SVTAV1: 5,
+}
+
+# Segments shorter than this decode cheaply enough that sharing one decoded
+# reference across the race is not worth the raw file
+_SHARED_REFERENCE_MIN_DURATION = 2.0
+
+# Planar YUV pixel formats the shared reference can be stored in raw,
+# e.g. yuv420p or yuv422p10le: chroma subsampling and bit depth
+_PLANAR_YUV_RE = re.compile(r"yuvj?(4\d\d)p(\d+)?(?:le|be)?")
+
+# Raw bytes per pixel at one byte per sample, by chroma subsampling
+_CHROMA_BYTES_PER_PIXEL = {"444": 3.0, "440": 2.0, "422": 2.0, "420": 1.5, "411": 1.5, "410": 1.125}
+
+# Headroom above vmaf_threshold aimed for when re-encoding a failed segment,
+# and the largest CRF step such a retry may take
+_CRF_SEARCH_VMAF_MARGIN = 0.5
+_CRF_SEARCH_MAX_STEP = 10
+
+# RAM-backed directory for intermediates, and how many times the input size
+# it must have free to be used
+_SHM_DIR = "/dev/shm"
+_SHM_HEADROOM = 8
+
+# Frame width used for scene scoring; scores are stable under downscaling
+_SCENE_ANALYSIS_WIDTH = 320
+
+# Analysis cache entry for motion scores
+_MOTION_ANALYSIS_NAME = "motion_scores"
+
+# Bytes hashed from each end of the input for the analysis cache key
+_ANALYSIS_CACHE_SAMPLE = 1 << 20
+
+# Analysis cache subdirectory holding per-encode quality metrics
+_METRICS_CACHE_DIR = "metrics"
+
+
+def _raw_frame_size(width: int, height: int, pix_fmt: str) -> Optional[float]:
+    """Bytes per raw frame in pix_fmt, or None for unsupported formats."""
+    match = _PLANAR_YUV_RE.fullmatch(pix_fmt)
+    if match is None or match.group(1) not in _CHROMA_BYTES_PER_PIXEL:
+        return None
+    sample_bytes = 2 if match.group(2) and int(match.group(2)) > 8 else 1
+    return width * height * _CHROMA_BYTES_PER_PIXEL[match.group(1)] * sample_bytes
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """Path of an executable on PATH, looked up once per process."""
+    return shutil.which(cmd)
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_ffmpeg_listing(ffmpeg_path: str, flag: str) -> str:
+    """Output of an ffmpeg listing such as ``-filters``, fetched once per process."""
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", flag],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            **_SPAWN_OPTIONS
+        )
+    except (subprocess.SubprocessError, OSError):
+        return ""
+    return result.stdout
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write ``data`` as JSON through a rename so readers never see a partial file."""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+def _file_size(path: str) -> Optional[int]:
+    """Size of a file in a single stat call, or None if it does not exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _fixed_boundaries(start: float, end: float, step: float) -> List[Tuple[float, float]]:
+    """(start, end) pairs splitting ``[start, end)`` into ``step``-long pieces.
+
+    Boundaries are computed from the piece index rather than by repeated
+    addition, so long ranges don't accumulate rounding drift.
+    """
+    if step <= 0:
+        raise ValueError(f"Segment duration must be positive, got {step}")
+    count = max(0, math.ceil((end - start) / step))
+    starts = (start + index * step for index in range(count))
+    return [(piece_start, min(piece_start + step, end)) for piece_start in starts if piece_start < end]
+
+
+class _MotionBins:
+    """Per-second frame and drop counts from mpdecimate's decisions."""
+
+    def __init__(self) -> None:
+        self.total_counts: List[int] = []
+        self.drop_counts: List[int] = []
+
+    def add(self, match: "re.Match[bytes]") -> None:
+        """Count one ``_MPDECIMATE_RE`` match."""
+        second = int(float(match.group(2)))
+        if second >= len(self.total_counts):
+            grow = second + 1 - len(self.total_counts)
+            self.total_counts.extend([0] * grow)
+            self.drop_counts.extend([0] * grow)
+        self.total_counts[second] += 1
+        if match.group(1) == b"drop":
+            self.drop_counts[second] += 1
+
+    def scores(self) -> List[Tuple[float, float]]:
+        """(second, motion score) pairs; a high drop rate means low motion."""
+        return [
+            (float(second), 1.0 - drops / total)
+            for second, (total, drops) in enumerate(zip(self.total_counts, self.drop_counts))
+            if total
+        ]
+
+
 @dataclass
 class PipelineConfig:
     """Configuration for the video pipeline."""
@@ -53,16 +232,53 @@ class PipelineConfig:
     psnr_threshold: float = GateThresholds.PSNR_LOSSLESS
     ssim_threshold: float = GateThresholds.SSIM_LOSSLESS
     use_multi_metric: bool = True  # Require VMAF OR (PSNR AND SSIM)
+    # Compute VMAF with libvmaf_cuda when ffmpeg supports it (multi-metric
+    # gate only; PSNR/SSIM still run on the CPU when GPU VMAF fails the gate)
+    use_cuda_vmaf: bool = True
+
+    # Skip the rest of the race when the fastest encoder beats the VMAF
+    # threshold by this margin (None always races every encoder)
+    vmaf_early_exit_margin: Optional[float] = 2.0
 
     # Fail-soft behavior
     escalate_on_gate_fail: bool = True
     fallback_crf_reduction: int = 4  # Reduce CRF by this amount on failure
+    # Estimated VMAF change per CRF step, used to pick a single retry CRF
+    # when VMAF is measured (fallback_crf_reduction applies otherwise)
+    vmaf_crf_slope: float = -0.8
 
     # Output
     output_container: str = "mp4"  # mp4, mkv, webm
 
+    # Directory for intermediate files (default: /dev/shm when it has room,
+    # else the system temp dir)
+    tmpdir: Optional[str] = None
+
+    # Directory caching scene/motion analysis and quality metrics across
+    # runs (default: no cache)
+    analysis_cache_dir: Optional[str] = None
+
     # Parallelism
     max_parallel_segments: int = 4
+    # Threads per ffmpeg process (default: CPU count / max_parallel_segments)
+    ffmpeg_threads_per_invocation: Optional[int] = None
+
+    # Stream-copy each segment to a temp file before encoding instead of
+    # seeking into the source (for inputs that seek poorly)
+    extract_segments: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_parallel_segments < 1:
+            raise ValueError(
+                f"max_parallel_segments must be at least 1, got {self.max_parallel_segments}"
+            )
+        if self.vmaf_crf_slope >= 0:
+            raise ValueError(f"vmaf_crf_slope must be negative, got {self.vmaf_crf_slope}")
+        threads = self.ffmpeg_threads_per_invocation
+        if threads is not None and not 1 <= threads <= 64:
+            raise ValueError(
+                f"ffmpeg_threads_per_invocation must be between 1 and 64, got {threads}"
+            )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -116,9 +332,14 @@ class PipelineResult:
         }
 
     def save_manifest(self, path: str) -> None:
-        """Save result manifest as JSON."""
+        """Save result manifest as JSON (serialized with orjson when installed)."""
+        manifest = self.to_dict()
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            return
         with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            json.dump(manifest, f, indent=2)
 
 
 class VideoPipeline:
@@ -136,51 +357,103 @@ class VideoPipeline:
 
     def __init__(self, config: Optional[PipelineConfig] = None):
         self.config = config or PipelineConfig()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._video_info_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+        # Per-thread count of race entrants sharing one segment's CPU budget
+        self._race_share = threading.local()
+        # Check if metrics pass the quality gate
+        self._check_gate = self._gate_checker()
         self._check_dependencies()
 
+    def __enter__(self) -> "VideoPipeline":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the segment worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Segment worker pool, created on first use and reused across runs."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.config.max_parallel_segments,
+                thread_name_prefix="rwv_segment",
+            )
+        return self._pool
+
     def _check_dependencies(self) -> None:
         """Check for required external dependencies."""
-        self._has_ffmpeg = self._check_command("ffmpeg")
-        self._has_ffprobe = self._check_command("ffprobe")
+        # Resolve executables once so each spawn skips the PATH search
+        self._ffmpeg_path = _which("ffmpeg")
+        self._ffprobe_path = _which("ffprobe")
+        self._has_ffmpeg = self._ffmpeg_path is not None
+        self._has_ffprobe = self._ffprobe_path is not None
         self._has_vmaf = self._check_vmaf_support()
+        self._has_vmaf_cuda = self.config.use_cuda_vmaf and self._check_vmaf_cuda()
         self._temp_dir: Optional[str] = None
+        self._source_bytes_per_second: Optional[float] = None
 
     def _check_command(self, cmd: str) -> bool:
         """Check if a command is available."""
-        return shutil.which(cmd) is not None
+        return _which(cmd) is not None
+
+    def _ffmpeg_command(self, args: List[str]) -> List[str]:
+        """Full ffmpeg command line for ``args``."""
+        return [self._ffmpeg_path or "ffmpeg", *_FFMPEG_GLOBAL_ARGS, *args]
+
+    def _ffmpeg_listing(self, flag: str) -> str:
+        """Output of an ffmpeg listing such as ``-filters``, fetched once."""
+        if not self._has_ffmpeg:
+            return ""
+        return _probe_ffmpeg_listing(self._ffmpeg_path, flag)
 
     def _check_vmaf_support(self) -> bool:
         """Check if ffmpeg has VMAF filter support."""
-        if not self._has_ffmpeg:
-            return False
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-filters"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return "libvmaf" in result.stdout
-        except (subprocess.SubprocessError, OSError):
+        return "libvmaf" in self._ffmpeg_listing("-filters")
+
+    def _check_vmaf_cuda(self) -> bool:
+        """Check if ffmpeg can decode and compute VMAF on an NVIDIA GPU."""
+        filters = self._ffmpeg_listing("-filters")
+        if "libvmaf_cuda" not in filters or "scale_npp" not in filters:
             return False
+        return "cuda" in self._ffmpeg_listing("-hwaccels").split()
 
     def _get_video_info(self, input_path: str) -> Dict[str, Any]:
-        """Get comprehensive video information using ffprobe."""
+        """Get comprehensive video information using ffprobe.
+
+        Results are cached per path, mtime and size, so repeated runs on an
+        unchanged file skip ffprobe.
+        """
         if not self._has_ffprobe:
             return {}
 
+        try:
+            stat = os.stat(input_path)
+        except OSError:
+            return {}
+        cache_key = (input_path, stat.st_mtime_ns, stat.st_size)
+        if cache_key in self._video_info_cache:
+            return self._video_info_cache[cache_key]
+
         try:
             cmd = [
-                "ffprobe",
+                self._ffprobe_path,
                 "-v", "quiet",
                 "-print_format", "json",
                 "-show_format",
                 "-show_streams",
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, **_SPAWN_OPTIONS)
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                info = json.loads(result.stdout)
+                self._video_info_cache[cache_key] = info
+                return info
         except (subprocess.SubprocessError, json.JSONDecodeError, OSError):
             pass
         return {}
@@ -188,12 +461,13 @@ class VideoPipeline:
     def _run_ffmpeg(self, args: List[str], timeout: int = 600) -> Tuple[bool, str]:
         """Run an ffmpeg command and return success status and output."""
         try:
-            cmd = ["ffmpeg", "-y", "-hide_banner"] + args
+            cmd = self._ffmpeg_command(args)
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                **_SPAWN_OPTIONS
             )
             return result.returncode == 0, result.stderr
         except subprocess.TimeoutExpired:
@@ -201,6 +475,32 @@ class VideoPipeline:
         except OSError as e:
             return False, str(e)
 
+    def _stream_ffmpeg_stderr(self, args: List[str], timeout: int = 600) -> Iterator[bytes]:
+        """Run an ffmpeg command and yield its stderr line by line.
+
+        Lines are parsed while ffmpeg is still decoding rather than buffered
+        whole. The process is killed if it outlives ``timeout`` seconds or
+        the caller stops iterating early.
+        """
+        process = subprocess.Popen(
+            self._ffmpeg_command(args),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20,
+            **_SPAWN_OPTIONS
+        )
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            yield from process.stderr
+            process.wait()
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stderr.close()
+
     def _extract_segment(self, input_path: str, segment: Segment,
                          output_path: str) -> bool:
         """Extract a segment from the input video."""
@@ -215,22 +515,55 @@ class VideoPipeline:
         return success
 
     def _encode_segment(self, input_path: str, output_path: str,
-                        encoder: EncoderConfig) -> Tuple[bool, float]:
-        """Encode a segment with the specified encoder configuration."""
-        encoder_map = {
-            EncoderID.X264: ("libx264", []),
-            EncoderID.X265: ("libx265", ["-tag:v", "hvc1"]),
-            EncoderID.SVTAV1: ("libsvtav1", []),
-            EncoderID.VP9: ("libvpx-vp9", ["-row-mt", "1"]),
-            EncoderID.NVENC_H264: ("h264_nvenc", []),
-            EncoderID.NVENC_HEVC: ("hevc_nvenc", []),
-        }
+                        encoder: EncoderConfig,
+                        segment: Optional[Segment] = None) -> Tuple[bool, float]:
+        """Encode a segment with the specified encoder configuration.
 
-        codec, extra_args = encoder_map.get(encoder.encoder_id, ("libx264", []))
+        When ``segment`` is given, ``input_path`` is the full source and the
+        segment's time range is seeked to directly rather than read from an
+        extracted copy.
+        """
+        args = self._input_args(input_path, segment) + self._encoder_args(encoder)
+        args.append(output_path)
+
+        start_time = time.time()
+        success, _ = self._run_ffmpeg(args)
+        encode_time = time.time() - start_time
+
+        return success, encode_time
+
+    def _encode_race(self, input_path: str,
+                     outputs: List[Tuple[EncoderConfig, str]],
+                     segment: Optional[Segment] = None) -> Tuple[bool, float]:
+        """Encode a segment with several encoders from a single decode.
+
+        The decoded video is split once per encoder inside one ffmpeg process,
+        so the source is read and decoded only once for the whole race. The
+        returned time is the wall time of the shared run.
+        """
+        count = len(outputs)
+        args = self._input_args(input_path, segment) + [
+            "-filter_complex",
+            f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count)),
+        ]
+        for i, (encoder, output_path) in enumerate(outputs):
+            args.extend(["-map", f"[v{i}]", "-map", "0:a?"])
+            args.extend(self._encoder_args(encoder))
+            args.append(output_path)
+
+        start_time = time.time()
+        success, _ = self._run_ffmpeg(args)
+        encode_time = time.time() - start_time
+
+        return success, encode_time
+
+    def _encoder_args(self, encoder: EncoderConfig) -> List[str]:
+        """Output arguments selecting and configuring an encoder."""
+        codec, extra_args = _ENCODER_CODECS.get(encoder.encoder_id, ("libx264", []))
 
         args = [
-            "-i", input_path,
             "-c:v", codec,
+            "-threads", str(self._ffmpeg_threads_per_invocation()),
             "-preset", encoder.preset,
             "-crf", str(encoder.crf),
             "-c:a", "copy",
@@ -242,97 +575,291 @@ class VideoPipeline:
         for key, value in encoder.extra_params.items():
             args.extend([f"-{key}", str(value)])
 
-        args.append(output_path)
+        return args
 
-        start_time = time.time()
-        success, _ = self._run_ffmpeg(args)
-        encode_time = time.time() - start_time
+    def _input_args(self, input_path: str, segment: Optional[Segment] = None) -> List[str]:
+        """Input arguments, seeking to ``segment`` when given.
 
-        return success, encode_time
+        ``-ss``/``-t`` are input options so the demuxer seeks straight to the
+        range; ffmpeg still decodes frame-accurately from the prior keyframe.
+        Decoder threads are capped per invocation.
+        """
+        threads = ["-threads", str(self._ffmpeg_threads_per_invocation())]
+        if segment is None:
+            return threads + ["-i", input_path]
+        return threads + [
+            "-ss", str(segment.start_time),
+            "-t", str(segment.duration),
+            "-i", input_path,
+        ]
+
+    def _ffmpeg_threads_per_invocation(self) -> int:
+        """Threads per ffmpeg process so concurrent segments share the CPUs.
 
-    def _compute_metrics(self, reference_path: str, distorted_path: str) -> PerceptualMetrics:
-        """Compute perceptual quality metrics (VMAF, PSNR, SSIM)."""
+        Inside a race, a segment's share is split again across the entrants
+        being measured at once.
+        """
+        if self.config.ffmpeg_threads_per_invocation is not None:
+            return self.config.ffmpeg_threads_per_invocation
+        workers = self.config.max_parallel_segments * getattr(self._race_share, "entrants", 1)
+        return max(1, (os.cpu_count() or workers) // workers)
+
+    def _compute_metrics(self, reference_path: str, distorted_path: str,
+                         segment: Optional[Segment] = None,
+                         reference_args: Optional[List[str]] = None) -> PerceptualMetrics:
+        """Compute perceptual quality metrics (VMAF, PSNR, SSIM).
+
+        All metrics come out of one ffmpeg run: both inputs are decoded once
+        and split across the psnr, ssim and (when available) libvmaf filters.
+        When ``segment`` is given, the reference is that time range of
+        ``reference_path``. ``reference_args``, from ``_decode_reference``,
+        replaces the CPU pass's reference input with an already decoded one.
+        """
         metrics = PerceptualMetrics()
 
         if not self._has_ffmpeg:
             return metrics
 
-        # Compute PSNR and SSIM using ffmpeg
+        cache_path = self._metrics_cache_path(reference_path, distorted_path, segment)
+        if cache_path is not None:
+            try:
+                with open(cache_path, 'r') as f:
+                    return PerceptualMetrics(**json.load(f))
+            except (OSError, ValueError, TypeError):
+                pass
+
+        # With a multi-metric gate a passing VMAF settles the gate on its
+        # own, so try it on the GPU first and skip the CPU pass when it passes
+        if self._has_vmaf_cuda and self.config.use_multi_metric:
+            gpu_metrics = self._compute_vmaf_cuda(reference_path, distorted_path, segment)
+            if gpu_metrics is not None:
+                metrics = gpu_metrics
+                # Not cached: without PSNR/SSIM the entry would not hold
+                # up under a different gate mode or threshold
+                if metrics.vmaf >= self.config.vmaf_threshold:
+                    return metrics
+
+        # PSNR and SSIM averages are read from the log, leaving stdout to
+        # libvmaf's JSON
+        with_vmaf = self._has_vmaf and metrics.vmaf is None
+        branches = ["psnr", "ssim"]
+        if with_vmaf:
+            branches.append("libvmaf" + _VMAF_LOG_OPTIONS)
+        count = len(branches)
+        graph = [
+            f"[0:v]split={count}" + "".join(f"[d{i}]" for i in range(count)),
+            f"[1:v]split={count}" + "".join(f"[r{i}]" for i in range(count)),
+        ]
+        graph.extend(f"[d{i}][r{i}]{branch}" for i, branch in enumerate(branches))
+
         try:
-            psnr_ssim_args = [
-                "-i", distorted_path,
-                "-i", reference_path,
-                "-lavfi", "[0:v][1:v]psnr=stats_file=-;[0:v][1:v]ssim=stats_file=-",
+            # psnr/ssim/libvmaf are SIMD and slice-threaded; cap the graph's
+            # threads like the decoders' so concurrent segments share the CPUs
+            metrics_args = [
+                "-filter_complex_threads", str(self._ffmpeg_threads_per_invocation()),
+            ]
+            metrics_args += self._input_args(distorted_path)
+            metrics_args += reference_args or self._input_args(reference_path, segment)
+            metrics_args += [
+                "-lavfi", ";".join(graph),
                 "-f", "null", "-"
             ]
             result = subprocess.run(
-                ["ffmpeg", "-y", "-hide_banner"] + psnr_ssim_args,
+                self._ffmpeg_command(metrics_args),
                 capture_output=True,
-                text=True,
-                timeout=300
+                timeout=600 if with_vmaf else 300,
+                **_SPAWN_OPTIONS
             )
 
             # Parse PSNR from output
-            psnr_match = re.search(r"PSNR.*average:(\d+\.?\d*)", result.stderr)
+            psnr_match = _PSNR_RE.search(result.stderr)
             if psnr_match:
                 metrics.psnr = float(psnr_match.group(1))
 
             # Parse SSIM from output
-            ssim_match = re.search(r"SSIM.*All:(\d+\.?\d*)", result.stderr)
+            ssim_match = _SSIM_RE.search(result.stderr)
             if ssim_match:
                 metrics.ssim = float(ssim_match.group(1))
 
+            if with_vmaf:
+                self._parse_vmaf(result, metrics)
+
         except (subprocess.SubprocessError, OSError):
             pass
 
-        # Compute VMAF if available
-        if self._has_vmaf:
+        if cache_path is not None and (metrics.psnr is not None or metrics.vmaf is not None):
             try:
-                vmaf_args = [
-                    "-i", distorted_path,
-                    "-i", reference_path,
-                    "-lavfi", "[0:v][1:v]libvmaf=log_fmt=json:log_path=-",
-                    "-f", "null", "-"
-                ]
-                result = subprocess.run(
-                    ["ffmpeg", "-y", "-hide_banner"] + vmaf_args,
-                    capture_output=True,
-                    text=True,
-                    timeout=600
-                )
-
-                # Parse VMAF from output
-                vmaf_match = re.search(r'"vmaf":\s*(\d+\.?\d*)', result.stderr + result.stdout)
-                if vmaf_match:
-                    metrics.vmaf = float(vmaf_match.group(1))
-
-            except (subprocess.SubprocessError, OSError):
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                entry = asdict(metrics)
+                if metrics.vmaf_per_frame is not None:
+                    entry["vmaf_per_frame"] = metrics.vmaf_per_frame.tolist()
+                _write_json_atomic(cache_path, entry)
+            except OSError:
                 pass
 
         return metrics
 
+    def _metrics_cache_path(self, reference_path: str, distorted_path: str,
+                            segment: Optional[Segment] = None) -> Optional[str]:
+        """Metrics cache file for a reference/encode pair, or None when the
+        analysis cache is disabled.
+
+        The reference is keyed like the analysis cache plus the segment's
+        time range; the encode is small enough to hash in full, so
+        byte-identical encodes share an entry.
+        """
+        cache_dir = self.config.analysis_cache_dir
+        if not cache_dir:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            digest.update(self._analysis_cache_key(reference_path).encode())
+            with open(distorted_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_ANALYSIS_CACHE_SAMPLE), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        if segment is not None:
+            digest.update(f":{segment.start_time}:{segment.end_time}".encode())
+        if self._has_vmaf:
+            digest.update(b":vmaf")
+        return os.path.join(cache_dir, _METRICS_CACHE_DIR, digest.hexdigest() + ".json")
+
+    def _decode_reference(self, input_path: str, segment: Optional[Segment],
+                          duration: float, output_path: str) -> Optional[List[str]]:
+        """Decode a segment once to raw video for reuse as a metrics reference.
+
+        The raw file keeps the source's pixel format, so metrics compare
+        against the same samples as a direct decode. Returns the ffmpeg
+        input arguments that read it back, or None if the source format is
+        unknown or not planar YUV, the raw file would not fit, or decoding
+        fails.
+        """
+        streams = self._get_video_info(input_path).get("streams", [])
+        video = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
+        if not video or not video.get("width") or not video.get("height"):
+            return None
+        pix_fmt = video.get("pix_fmt") or ""
+        frame_size = _raw_frame_size(video["width"], video["height"], pix_fmt)
+        try:
+            frame_rate = Fraction(video.get("r_frame_rate") or "")
+        except (ValueError, ZeroDivisionError):
+            return None
+        if frame_size is None or frame_rate <= 0:
+            return None
+
+        # Every segment in flight may hold its reference at once
+        raw_size = frame_size * float(frame_rate) * duration
+        try:
+            free = shutil.disk_usage(os.path.dirname(output_path)).free
+        except OSError:
+            return None
+        if raw_size * self.config.max_parallel_segments > free:
+            return None
+
+        args = self._input_args(input_path, segment) + [
+            "-map", "0:v:0",
+            "-f", "rawvideo",
+            "-pix_fmt", pix_fmt,
+            output_path
+        ]
+        success, _ = self._run_ffmpeg(args)
+        if not success:
+            return None
+        return [
+            "-f", "rawvideo",
+            "-pix_fmt", pix_fmt,
+            "-video_size", f"{video['width']}x{video['height']}",
+            "-framerate", video["r_frame_rate"],
+            "-i", output_path,
+        ]
+
+    def _parse_vmaf(self, result: subprocess.CompletedProcess,
+                    metrics: PerceptualMetrics) -> None:
+        """Fill in VMAF from a libvmaf run.
+
+        The JSON log on stdout gives the pooled mean and per-frame scores;
+        without it, the pooled score ffmpeg logs is used.
+        """
+        try:
+            log = _json_loads(result.stdout)
+            metrics.vmaf = float(log["pooled_metrics"]["vmaf"]["mean"])
+            metrics.vmaf_per_frame = array(
+                'f', (float(frame["metrics"]["vmaf"]) for frame in log.get("frames", []))
+            )
+            return
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        vmaf_match = _VMAF_SCORE_RE.search(result.stderr)
+        if vmaf_match:
+            metrics.vmaf = float(vmaf_match.group(1))
+
+    def _compute_vmaf_cuda(self, reference_path: str, distorted_path: str,
+                           segment: Optional[Segment] = None) -> Optional[PerceptualMetrics]:
+        """Compute VMAF with libvmaf_cuda, keeping frames on the GPU.
+
+        Returns None if the GPU run fails so the caller can use the CPU path.
+        """
+        hwaccel = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+        args = hwaccel + self._input_args(distorted_path)
+        args += hwaccel + self._input_args(reference_path, segment)
+        args += [
+            "-filter_complex",
+            "[0:v]scale_npp=format=yuv420p[d];"
+            "[1:v]scale_npp=format=yuv420p[r];"
+            "[d][r]libvmaf_cuda" + _VMAF_LOG_OPTIONS,
+            "-f", "null", "-"
+        ]
+        try:
+            result = subprocess.run(
+                self._ffmpeg_command(args),
+                capture_output=True,
+                timeout=600,
+                **_SPAWN_OPTIONS
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+
+        if result.returncode != 0:
+            return None
+        metrics = PerceptualMetrics()
+        self._parse_vmaf(result, metrics)
+        return metrics if metrics.vmaf is not None else None
+
     def _detect_scene_changes(self, input_path: str, threshold: float = 0.4) -> List[float]:
-        """Detect scene changes in the video using ffmpeg scene filter."""
+        """Detect scene changes in the video.
+
+        Uses PySceneDetect on downscaled frames when it is installed, and the
+        ffmpeg scene filter on downscaled frames otherwise.
+        """
         scene_times = [0.0]  # Always start at 0
 
+        if scenedetect is not None:
+            try:
+                candidates = self._detect_scene_changes_scenedetect(input_path, threshold)
+            except Exception:
+                candidates = None
+            if candidates is not None:
+                for scene_time in candidates:
+                    if scene_time > scene_times[-1] + self.config.min_segment_duration:
+                        scene_times.append(scene_time)
+                return scene_times
+
         if not self._has_ffmpeg:
             return scene_times
 
         try:
-            args = [
-                "-i", input_path,
-                "-vf", f"select='gt(scene,{threshold})',showinfo",
+            args = self._input_args(input_path) + [
+                "-vf", f"scale={_SCENE_ANALYSIS_WIDTH}:-2,select='gt(scene,{threshold})',showinfo",
                 "-f", "null", "-"
             ]
-            result = subprocess.run(
-                ["ffmpeg", "-y", "-hide_banner"] + args,
-                capture_output=True,
-                text=True,
-                timeout=600
-            )
-
             # Parse scene change times from showinfo output
-            for match in re.finditer(r"pts_time:(\d+\.?\d*)", result.stderr):
+            for line in self._stream_ffmpeg_stderr(args):
+                match = _PTS_RE.search(line)
+                if not match:
+                    continue
                 scene_time = float(match.group(1))
                 if scene_time > scene_times[-1] + self.config.min_segment_duration:
                     scene_times.append(scene_time)
@@ -342,6 +869,20 @@ class VideoPipeline:
 
         return scene_times
 
+    def _detect_scene_changes_scenedetect(self, input_path: str, threshold: float) -> List[float]:
+        """Scene start times from PySceneDetect's content detector.
+
+        ``threshold`` is on ffmpeg's 0-1 scene score scale.
+        """
+        video = scenedetect.open_video(input_path)
+        width = video.frame_size[0]
+        manager = scenedetect.SceneManager()
+        manager.auto_downscale = False
+        manager.downscale = max(1, width // _SCENE_ANALYSIS_WIDTH)
+        manager.add_detector(scenedetect.ContentDetector(threshold=threshold * 100))
+        manager.detect_scenes(video, show_progress=False)
+        return [start.get_seconds() for start, _ in manager.get_scene_list()]
+
     def _analyze_motion(self, input_path: str) -> List[Tuple[float, float]]:
         """Analyze motion complexity to determine adaptive segment boundaries."""
         motion_data: List[Tuple[float, float]] = []
@@ -350,56 +891,156 @@ class VideoPipeline:
             return motion_data
 
         try:
-            # Use mpdecimate filter to detect motion
-            args = [
-                "-i", input_path,
-                "-vf", "mpdecimate=hi=64*12:lo=64*5:frac=0.33,showinfo",
+            # mpdecimate logs a keep/drop decision per frame at debug level;
+            # a high drop rate indicates low motion
+            args = ["-loglevel", "debug"] + self._input_args(input_path) + [
+                "-vf", "mpdecimate=hi=64*12:lo=64*5:frac=0.33",
                 "-f", "null", "-"
             ]
-            result = subprocess.run(
-                ["ffmpeg", "-y", "-hide_banner"] + args,
-                capture_output=True,
-                text=True,
-                timeout=600
-            )
 
-            # Parse motion data - high drop rate indicates low motion
-            current_time = 0.0
-            drop_count = 0
-            total_count = 0
+            bins = _MotionBins()
+            for line in self._stream_ffmpeg_stderr(args):
+                match = _MPDECIMATE_RE.search(line)
+                if match:
+                    bins.add(match)
+            motion_data = bins.scores()
+
+        except (subprocess.SubprocessError, OSError):
+            pass
+
+        return motion_data
 
-            for match in re.finditer(r"pts_time:(\d+\.?\d*)", result.stderr):
-                frame_time = float(match.group(1))
-                total_count += 1
+    def _analyze_scene_and_motion(self, input_path: str, threshold: float = 0.4
+                                  ) -> Tuple[List[float], List[Tuple[float, float]]]:
+        """Scene changes and motion scores from a single decode of the input.
 
-                # Every ~1 second of frames, calculate motion score
-                if frame_time >= current_time + 1.0:
-                    if total_count > 0:
-                        motion_score = 1.0 - (drop_count / max(total_count, 1))
-                        motion_data.append((current_time, motion_score))
-                    current_time = frame_time
-                    drop_count = 0
-                    total_count = 0
+        The decoded video is split between the scene and mpdecimate branches
+        of one filter graph; results match ``_detect_scene_changes`` (ffmpeg
+        path) and ``_analyze_motion``.
+        """
+        scene_times = [0.0]
+        bins = _MotionBins()
+
+        if not self._has_ffmpeg:
+            return scene_times, bins.scores()
+
+        try:
+            args = ["-loglevel", "debug"] + self._input_args(input_path) + [
+                "-filter_complex",
+                f"[0:v]split=2[a][b];"
+                f"[a]scale={_SCENE_ANALYSIS_WIDTH}:-2,select='gt(scene,{threshold})',showinfo[scene];"
+                f"[b]mpdecimate=hi=64*12:lo=64*5:frac=0.33[motion]",
+                "-map", "[scene]", "-f", "null", "-",
+                "-map", "[motion]", "-f", "null", "-"
+            ]
+            for line in self._stream_ffmpeg_stderr(args):
+                match = _MPDECIMATE_RE.search(line)
+                if match:
+                    bins.add(match)
+                    continue
+                if b"Parsed_showinfo" not in line:
+                    continue
+                match = _PTS_RE.search(line)
+                if match:
+                    scene_time = float(match.group(1))
+                    if scene_time > scene_times[-1] + self.config.min_segment_duration:
+                        scene_times.append(scene_time)
 
         except (subprocess.SubprocessError, OSError):
             pass
 
-        return motion_data
+        return scene_times, bins.scores()
+
+    def _segmentation_analysis(self, input_path: str, name: str) -> Dict[str, Any]:
+        """Run the analysis behind cache entry ``name``.
+
+        Without PySceneDetect, scene and motion analysis share one ffmpeg
+        pass and both entries are returned, so a re-run with the other
+        strategy is served from the cache.
+        """
+        scene_name = self._scene_analysis_name()
+        if scenedetect is None and self._has_ffmpeg:
+            scene_times, motion_data = self._analyze_scene_and_motion(input_path)
+            return {scene_name: scene_times, _MOTION_ANALYSIS_NAME: motion_data}
+        if name == _MOTION_ANALYSIS_NAME:
+            return {name: self._analyze_motion(input_path)}
+        return {name: self._detect_scene_changes(input_path)}
+
+    def _scene_analysis_name(self) -> str:
+        """Analysis cache entry for scene times (they depend on the minimum
+        segment duration)."""
+        return f"scene_times:{self.config.min_segment_duration}"
+
+    def _analysis_cache_key(self, input_path: str) -> str:
+        """Cache key for an input: its size, mtime and first and last MiB.
+
+        Cheap to compute on large files, and changes whenever the file is
+        rewritten.
+        """
+        stat = os.stat(input_path)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        with open(input_path, 'rb') as f:
+            digest.update(f.read(_ANALYSIS_CACHE_SAMPLE))
+            if stat.st_size > _ANALYSIS_CACHE_SAMPLE:
+                f.seek(max(_ANALYSIS_CACHE_SAMPLE, stat.st_size - _ANALYSIS_CACHE_SAMPLE))
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _cached_analysis(self, input_path: str, name: str,
+                         compute: Callable[[], Dict[str, Any]]) -> Any:
+        """Return analysis ``name`` for an input, running ``compute`` on a miss.
+
+        ``compute`` returns every entry its pass produced, keyed by name.
+        Results are stored as JSON under ``config.analysis_cache_dir``, one
+        file per input, so re-runs on the same file skip the decode pass.
+        """
+        cache_dir = self.config.analysis_cache_dir
+        if not cache_dir:
+            return compute().get(name)
+
+        try:
+            cache_path = os.path.join(cache_dir, self._analysis_cache_key(input_path) + ".json")
+        except OSError:
+            return compute().get(name)
+
+        entries: Dict[str, Any] = {}
+        try:
+            with open(cache_path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if name in entries:
+            return entries[name]
+
+        computed = compute()
+        produced = {key: value for key, value in computed.items() if value}
+        if produced:
+            entries.update(produced)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                _write_json_atomic(cache_path, entries)
+            except OSError:
+                pass
+        return computed.get(name)
 
     def _concatenate_segments(self, segment_paths: List[str], output_path: str) -> bool:
         """Concatenate encoded segments into final output."""
         if not self._has_ffmpeg or not segment_paths:
             return False
 
-        # Create concat file
-        concat_file = os.path.join(self._temp_dir or tempfile.gettempdir(), "concat_list.txt")
-        try:
-            with open(concat_file, 'w') as f:
-                for path in segment_paths:
-                    # Escape special characters in path
-                    escaped_path = path.replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
+        # Build the concat list in one string, escaping quotes in paths, and
+        # write it to a uniquely named file so concurrent calls don't clash
+        concat_list = "".join(
+            "file '{}'\n".format(path.replace("'", "'\\''")) for path in segment_paths
+        )
+        with tempfile.NamedTemporaryFile(
+            'w', dir=self._temp_dir, prefix="concat_", suffix=".txt", delete=False
+        ) as f:
+            f.write(concat_list)
+            concat_file = f.name
 
+        try:
             args = [
                 "-f", "concat",
                 "-safe", "0",
@@ -411,8 +1052,10 @@ class VideoPipeline:
             return success
 
         finally:
-            if os.path.exists(concat_file):
+            try:
                 os.remove(concat_file)
+            except FileNotFoundError:
+                pass
 
     def run(self, input_path: str, output_path: str) -> PipelineResult:
         """
@@ -426,9 +1069,12 @@ class VideoPipeline:
             PipelineResult with processing details
         """
         start_time = time.time()
+        # Pick up any config changes made since the last run
+        self._check_gate = self._gate_checker()
 
         # Validate input
-        if not os.path.exists(input_path):
+        input_size = _file_size(input_path)
+        if input_size is None:
             return PipelineResult(
                 input_path=input_path,
                 output_path=output_path,
@@ -441,8 +1087,6 @@ class VideoPipeline:
                 error=f"Input file not found: {input_path}"
             )
 
-        input_size = os.path.getsize(input_path)
-
         if not self._has_ffmpeg:
             return PipelineResult(
                 input_path=input_path,
@@ -457,56 +1101,51 @@ class VideoPipeline:
             )
 
         # Create temporary directory for intermediate files
-        self._temp_dir = tempfile.mkdtemp(prefix="rwv_pipeline_")
+        self._temp_dir = tempfile.mkdtemp(prefix="rwv_pipeline_", dir=self._temp_root(input_size))
 
         try:
             # Stage 1: Decode (get video info)
             video_info = self._get_video_info(input_path)
-            duration = self._get_duration(input_path)
+            duration = self._get_duration(input_path, video_info)
+            self._source_bytes_per_second = input_size / duration if duration > 0 else 0.0
 
             # Stage 2: Segment based on strategy
             segments = self._create_segments(duration, input_path)
 
             # Stage 3-5: Process segments with WeaveRace
-            segment_results = []
-            encoded_segment_paths = []
-
-            with ThreadPoolExecutor(max_workers=self.config.max_parallel_segments) as executor:
-                future_to_segment = {
-                    executor.submit(
-                        self._process_segment,
-                        segment,
-                        input_path
-                    ): segment
-                    for segment in segments
-                }
-
-                for future in as_completed(future_to_segment):
-                    segment = future_to_segment[future]
-                    try:
-                        result, encoded_path = future.result()
-                        segment_results.append(result)
-                        if encoded_path:
-                            encoded_segment_paths.append((segment.segment_id, encoded_path))
-                    except Exception as e:
-                        # Create failed result for this segment
-                        segment_results.append(SegmentResult(
-                            segment=segment,
-                            chosen_encoder=self.config.enabled_encoders[0] if self.config.enabled_encoders else EncoderConfig(EncoderID.X264),
-                            metrics=PerceptualMetrics(),
-                            input_size=0,
-                            output_size=0,
-                            encode_time=0,
-                            passed_gate=False,
-                        ))
-
-            # Sort results by segment_id
-            segment_results.sort(key=lambda r: r.segment.segment_id)
-            encoded_segment_paths.sort(key=lambda x: x[0])
+            # Results land in their segment's slot, so no sorting is needed
+            segment_results: List[Optional[SegmentResult]] = [None] * len(segments)
+            encoded_segment_paths: List[Optional[str]] = [None] * len(segments)
+
+            executor = self._executor()
+            future_to_index = {
+                executor.submit(
+                    self._process_segment,
+                    segment,
+                    input_path
+                ): index
+                for index, segment in enumerate(segments)
+            }
+
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    segment_results[index], encoded_segment_paths[index] = future.result()
+                except Exception as e:
+                    # Create failed result for this segment
+                    segment_results[index] = SegmentResult(
+                        segment=segments[index],
+                        chosen_encoder=self.config.enabled_encoders[0] if self.config.enabled_encoders else EncoderConfig(EncoderID.X264),
+                        metrics=PerceptualMetrics(),
+                        input_size=0,
+                        output_size=0,
+                        encode_time=0,
+                        passed_gate=False,
+                    )
 
             # Stage 6: Package - concatenate segments
-            if encoded_segment_paths:
-                sorted_paths = [path for _, path in encoded_segment_paths]
+            sorted_paths = [path for path in encoded_segment_paths if path]
+            if sorted_paths:
                 concat_success = self._concatenate_segments(sorted_paths, output_path)
                 if not concat_success:
                     return PipelineResult(
@@ -522,9 +1161,7 @@ class VideoPipeline:
                     )
 
             # Calculate output size
-            total_output_size = 0
-            if os.path.exists(output_path):
-                total_output_size = os.path.getsize(output_path)
+            total_output_size = _file_size(output_path) or 0
 
             elapsed = time.time() - start_time
 
@@ -555,24 +1192,55 @@ class VideoPipeline:
 
         finally:
             # Cleanup temporary directory
-            if self._temp_dir and os.path.exists(self._temp_dir):
+            if self._temp_dir:
                 shutil.rmtree(self._temp_dir, ignore_errors=True)
             self._temp_dir = None
+            self._source_bytes_per_second = None
+
+    def _temp_root(self, input_size: int) -> Optional[str]:
+        """Parent directory for a run's intermediate files.
+
+        Every segment is written once per encoder, so a RAM-backed tmpfs is
+        preferred when it has ample room.
+        """
+        if self.config.tmpdir:
+            return self.config.tmpdir
+        try:
+            if shutil.disk_usage(_SHM_DIR).free >= input_size * _SHM_HEADROOM:
+                return _SHM_DIR
+        except OSError:
+            pass
+        return None
+
+    def _estimate_segment_size(self, input_path: str, segment: Segment) -> int:
+        """Approximate a segment's share of the source size by its duration."""
+        if self._source_bytes_per_second is None:
+            duration = self._get_duration(input_path, self._get_video_info(input_path))
+            size = _file_size(input_path) or 0
+            self._source_bytes_per_second = size / duration if duration > 0 else 0.0
+        return int(segment.duration * self._source_bytes_per_second)
+
+    def _get_duration(self, input_path: str,
+                      video_info: Optional[Dict[str, Any]] = None) -> float:
+        """Get video duration, from ``video_info`` if given, else ffprobe."""
+        if video_info:
+            try:
+                return float(video_info["format"]["duration"])
+            except (KeyError, TypeError, ValueError):
+                pass
 
-    def _get_duration(self, input_path: str) -> float:
-        """Get video duration using ffprobe."""
         if not self._has_ffprobe:
             return 60.0  # Default fallback
 
         try:
             cmd = [
-                "ffprobe",
+                self._ffprobe_path,
                 "-v", "quiet",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 input_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, **_SPAWN_OPTIONS)
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
         except (subprocess.SubprocessError, ValueError, OSError):
@@ -590,7 +1258,12 @@ class VideoPipeline:
 
         elif self.config.segmentation_strategy == SegmentationStrategy.SCENE_CUT:
             if input_path:
-                scene_times = self._detect_scene_changes(input_path)
+                scene_name = self._scene_analysis_name()
+                scene_times = list(self._cached_analysis(
+                    input_path,
+                    scene_name,
+                    lambda: self._segmentation_analysis(input_path, scene_name),
+                ) or [0.0])
                 scene_times.append(duration)  # Add end point
 
                 for i in range(len(scene_times) - 1):
@@ -600,16 +1273,15 @@ class VideoPipeline:
                     # Enforce min/max segment duration
                     if end - start > self.config.max_segment_duration:
                         # Split long segments
-                        current = start
-                        while current < end:
-                            seg_end = min(current + self.config.segment_duration, end)
+                        for seg_start, seg_end in _fixed_boundaries(
+                            start, end, self.config.segment_duration
+                        ):
                             segments.append(Segment(
                                 segment_id=segment_id,
-                                start_time=current,
+                                start_time=seg_start,
                                 end_time=seg_end,
                             ))
                             segment_id += 1
-                            current = seg_end
                     elif end - start >= self.config.min_segment_duration:
                         segments.append(Segment(
                             segment_id=segment_id,
@@ -641,22 +1313,27 @@ class VideoPipeline:
 
         elif self.config.segmentation_strategy == SegmentationStrategy.MOTION_ADAPTIVE:
             if input_path:
-                motion_data = self._analyze_motion(input_path)
+                motion_data = [
+                    (time_point, score)
+                    for time_point, score in self._cached_analysis(
+                        input_path,
+                        _MOTION_ANALYSIS_NAME,
+                        lambda: self._segmentation_analysis(input_path, _MOTION_ANALYSIS_NAME),
+                    ) or []
+                ]
 
                 if not motion_data:
                     return self._create_segments_fixed(duration)
 
                 # Create segments based on motion complexity
                 # High motion = shorter segments, low motion = longer segments
+                motion_times = [time_point for time_point, _ in motion_data]
                 current_time = 0.0
                 while current_time < duration:
-                    # Find motion score for current time
-                    motion_score = 0.5  # Default medium motion
-                    for time_point, score in motion_data:
-                        if time_point <= current_time:
-                            motion_score = score
-                        else:
-                            break
+                    # Find motion score for current time (latest sample at or
+                    # before it)
+                    index = bisect.bisect_right(motion_times, current_time) - 1
+                    motion_score = motion_data[index][1] if index >= 0 else 0.5
 
                     # Calculate segment duration based on motion
                     # High motion (score > 0.7) -> shorter segments
@@ -685,28 +1362,19 @@ class VideoPipeline:
 
     def _create_segments_fixed(self, duration: float) -> List[Segment]:
         """Create fixed-duration segments."""
-        segments = []
-        segment_id = 0
-        current_time = 0.0
-
-        while current_time < duration:
-            end_time = min(current_time + self.config.segment_duration, duration)
-            segments.append(Segment(
-                segment_id=segment_id,
-                start_time=current_time,
-                end_time=end_time,
-            ))
-            segment_id += 1
-            current_time = end_time
-
-        return segments
+        return [
+            Segment(segment_id=segment_id, start_time=start, end_time=end)
+            for segment_id, (start, end) in enumerate(
+                _fixed_boundaries(0.0, duration, self.config.segment_duration)
+            )
+        ]
 
     def _process_segment(self, segment: Segment, input_path: str) -> Tuple[SegmentResult, Optional[str]]:
         """
         Process a single segment through WeaveRace.
 
         Implements:
-        1. Extract segment from source
+        1. Seek to the segment in the source (or extract it when configured)
         2. Encode with multiple encoders (WeaveRace)
         3. Compute perceptual metrics for each encoding
         4. Gate check against quality thresholds
@@ -717,44 +1385,150 @@ class VideoPipeline:
             Tuple of (SegmentResult, path to encoded segment file)
         """
         if not self._temp_dir:
-            self._temp_dir = tempfile.mkdtemp(prefix="rwv_pipeline_")
+            self._temp_dir = tempfile.mkdtemp(prefix="rwv_pipeline_", dir=self.config.tmpdir)
 
-        # Extract segment to temp file
-        segment_source = os.path.join(
-            self._temp_dir,
-            f"segment_{segment.segment_id}_source.mkv"
-        )
+        if self.config.extract_segments:
+            # Extract segment to temp file
+            segment_source = os.path.join(
+                self._temp_dir,
+                f"segment_{segment.segment_id}_source.mkv"
+            )
 
-        if not self._extract_segment(input_path, segment, segment_source):
-            return SegmentResult(
-                segment=segment,
-                chosen_encoder=self.config.enabled_encoders[0] if self.config.enabled_encoders else EncoderConfig(EncoderID.X264),
-                metrics=PerceptualMetrics(),
-                input_size=0,
-                output_size=0,
-                encode_time=0,
-                passed_gate=False,
-            ), None
+            if not self._extract_segment(input_path, segment, segment_source):
+                return SegmentResult(
+                    segment=segment,
+                    chosen_encoder=self.config.enabled_encoders[0] if self.config.enabled_encoders else EncoderConfig(EncoderID.X264),
+                    metrics=PerceptualMetrics(),
+                    input_size=0,
+                    output_size=0,
+                    encode_time=0,
+                    passed_gate=False,
+                ), None
+
+            input_size = _file_size(segment_source) or 0
+            source_range: Optional[Segment] = None
+        else:
+            # Encode and measure straight from the source
+            segment_source = input_path
+            input_size = self._estimate_segment_size(input_path, segment)
+            source_range = segment
+
+        # Every entrant is measured against the same reference; decode it once
+        # (the GPU metrics path decodes on the device instead). The decode
+        # runs alongside the first encodes and metrics wait for it.
+        reference_path: Optional[str] = None
+        try:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rwv_reference") as decoder:
+                reference: Optional["Future[Optional[List[str]]]"] = None
+                if (len(self.config.enabled_encoders) > 1 and not self._has_vmaf_cuda and
+                        segment.duration >= _SHARED_REFERENCE_MIN_DURATION):
+                    reference_path = os.path.join(
+                        self._temp_dir,
+                        f"segment_{segment.segment_id}_reference.yuv"
+                    )
+                    reference = decoder.submit(
+                        self._decode_reference, segment_source, source_range,
+                        segment.duration, reference_path
+                    )
 
-        input_size = os.path.getsize(segment_source) if os.path.exists(segment_source) else 0
+                return self._race_encoders(
+                    segment, segment_source, source_range, input_size, reference
+                )
+        finally:
+            if reference_path:
+                try:
+                    os.remove(reference_path)
+                except FileNotFoundError:
+                    pass
+
+    def _race_encoders(self, segment: Segment, segment_source: str,
+                       source_range: Optional[Segment], input_size: int,
+                       reference: Optional["Future[Optional[List[str]]]"] = None
+                       ) -> Tuple[SegmentResult, Optional[str]]:
+        """Encode a segment with every enabled encoder and pick the result.
+
+        Runs steps 2-6 of ``_process_segment``. ``reference`` resolves to
+        the shared reference's input arguments (see ``_decode_reference``).
+        """
+        def reference_args() -> Optional[List[str]]:
+            return reference.result() if reference is not None else None
 
         # WeaveRace: encode with all enabled encoders
         encoder_results: List[Tuple[EncoderConfig, str, float, PerceptualMetrics, int]] = []
 
-        for encoder in self.config.enabled_encoders:
-            encoded_path = os.path.join(
+        race_outputs = [
+            (encoder, os.path.join(
                 self._temp_dir,
                 f"segment_{segment.segment_id}_{encoder.encoder_id.value}.mkv"
-            )
+            ))
+            for encoder in self.config.enabled_encoders
+        ]
 
-            success, encode_time = self._encode_segment(segment_source, encoded_path, encoder)
+        # Try the fastest encoder on its own first; if it clears the VMAF
+        # gate by a comfortable margin, the slower entrants are not worth
+        # encoding
+        margin = self.config.vmaf_early_exit_margin
+        if margin is not None and len(race_outputs) > 1 and (self._has_vmaf or self._has_vmaf_cuda):
+            race_outputs.sort(key=lambda item: _ENCODER_SPEED_ORDER.get(
+                item[0].encoder_id, len(_ENCODER_SPEED_ORDER)
+            ))
+            encoder, encoded_path = race_outputs.pop(0)
+            success, encode_time = self._encode_segment(segment_source, encoded_path, encoder, source_range)
+            output_size = _file_size(encoded_path) if success else None
 
-            if success and os.path.exists(encoded_path):
-                # Compute metrics
-                metrics = self._compute_metrics(segment_source, encoded_path)
-                output_size = os.path.getsize(encoded_path)
+            if output_size is not None:
+                metrics = self._compute_metrics(
+                    segment_source, encoded_path, source_range, reference_args()
+                )
+                if (metrics.vmaf is not None and
+                        metrics.vmaf >= self.config.vmaf_threshold + margin and
+                        self._check_gate(metrics)):
+                    return SegmentResult(
+                        segment=segment,
+                        chosen_encoder=encoder,
+                        metrics=metrics,
+                        input_size=input_size,
+                        output_size=output_size,
+                        encode_time=encode_time,
+                        passed_gate=True,
+                    ), encoded_path
                 encoder_results.append((encoder, encoded_path, encode_time, metrics, output_size))
 
+        # Decode once for all encoders; if the shared run fails (e.g. one
+        # encoder is unavailable), fall back to encoding each one separately
+        race_time: Optional[float] = None
+        if len(race_outputs) > 1:
+            success, elapsed = self._encode_race(segment_source, race_outputs, source_range)
+            if success:
+                race_time = elapsed
+
+        # Each entrant's encode (without a shared run) and metrics pass is
+        # its own ffmpeg process, so measure them concurrently on a split of
+        # this segment's threads
+        def measure(entrant: Tuple[EncoderConfig, str]
+                    ) -> Optional[Tuple[EncoderConfig, str, float, PerceptualMetrics, int]]:
+            encoder, encoded_path = entrant
+            self._race_share.entrants = len(race_outputs)
+            if race_time is not None:
+                success, encode_time = True, race_time
+            else:
+                success, encode_time = self._encode_segment(segment_source, encoded_path, encoder, source_range)
+            output_size = _file_size(encoded_path) if success else None
+            if output_size is None:
+                return None
+
+            metrics = self._compute_metrics(
+                segment_source, encoded_path, source_range, reference_args()
+            )
+            return encoder, encoded_path, encode_time, metrics, output_size
+
+        if len(race_outputs) > 1:
+            with ThreadPoolExecutor(max_workers=len(race_outputs)) as race_pool:
+                measured = list(race_pool.map(measure, race_outputs))
+        else:
+            measured = [measure(entrant) for entrant in race_outputs]
+        encoder_results.extend(result for result in measured if result is not None)
+
         if not encoder_results:
             return SegmentResult(
                 segment=segment,
@@ -766,17 +1540,15 @@ class VideoPipeline:
                 passed_gate=False,
             ), None
 
-        # Gate check and selection
-        passing_results = []
-        for encoder, path, enc_time, metrics, size in encoder_results:
-            passes_gate = self._check_gate(metrics)
-            if passes_gate:
-                passing_results.append((encoder, path, enc_time, metrics, size))
-
-        # Select best result (smallest size that passes gate)
-        if passing_results:
-            passing_results.sort(key=lambda x: x[4])  # Sort by size
-            chosen_encoder, chosen_path, encode_time, metrics, output_size = passing_results[0]
+        # Gate check and selection: smallest result that passes the gate,
+        # found in one pass
+        best_passing = min(
+            (result for result in encoder_results if self._check_gate(result[3])),
+            key=lambda result: result[4],
+            default=None,
+        )
+        if best_passing is not None:
+            chosen_encoder, chosen_path, encode_time, metrics, output_size = best_passing
 
             return SegmentResult(
                 segment=segment,
@@ -790,25 +1562,22 @@ class VideoPipeline:
 
         # Fail-soft: try with escalated quality settings
         if self.config.escalate_on_gate_fail:
-            for encoder in self.config.enabled_encoders:
-                escalated_encoder = EncoderConfig(
-                    encoder_id=encoder.encoder_id,
-                    preset=encoder.preset,
-                    crf=max(0, encoder.crf - self.config.fallback_crf_reduction),
-                    tune=encoder.tune,
-                    extra_params=encoder.extra_params,
-                )
-
+            for escalated_encoder in self._escalation_candidates(encoder_results):
                 escalated_path = os.path.join(
                     self._temp_dir,
-                    f"segment_{segment.segment_id}_{encoder.encoder_id.value}_escalated.mkv"
+                    f"segment_{segment.segment_id}_{escalated_encoder.encoder_id.value}_escalated.mkv"
                 )
 
-                success, encode_time = self._encode_segment(segment_source, escalated_path, escalated_encoder)
+                success, encode_time = self._encode_segment(
+                    segment_source, escalated_path, escalated_encoder, source_range
+                )
+
+                output_size = _file_size(escalated_path) if success else None
 
-                if success and os.path.exists(escalated_path):
-                    metrics = self._compute_metrics(segment_source, escalated_path)
-                    output_size = os.path.getsize(escalated_path)
+                if output_size is not None:
+                    metrics = self._compute_metrics(
+                        segment_source, escalated_path, source_range, reference_args()
+                    )
 
                     if self._check_gate(metrics):
                         return SegmentResult(
@@ -821,9 +1590,10 @@ class VideoPipeline:
                             passed_gate=True,
                         ), escalated_path
 
-        # No result passed gate, return best failing result
-        encoder_results.sort(key=lambda x: x[4])  # Sort by size
-        chosen_encoder, chosen_path, encode_time, metrics, output_size = encoder_results[0]
+        # No result passed gate, return best failing result (smallest)
+        chosen_encoder, chosen_path, encode_time, metrics, output_size = min(
+            encoder_results, key=lambda result: result[4]
+        )
 
         return SegmentResult(
             segment=segment,
@@ -835,28 +1605,80 @@ class VideoPipeline:
             passed_gate=False,
         ), chosen_path
 
-    def _check_gate(self, metrics: PerceptualMetrics) -> bool:
-        """Check if metrics pass the quality gate."""
-        if self.config.use_multi_metric:
-            # Multi-metric: VMAF passes OR (PSNR AND SSIM) pass
-            vmaf_passes = (metrics.vmaf is not None and
-                          metrics.vmaf >= self.config.vmaf_threshold)
-            psnr_ssim_passes = (
-                metrics.psnr is not None and
-                metrics.ssim is not None and
-                metrics.psnr >= self.config.psnr_threshold and
-                metrics.ssim >= self.config.ssim_threshold
+    def _escalation_candidates(
+        self,
+        encoder_results: List[Tuple[EncoderConfig, str, float, PerceptualMetrics, int]],
+    ) -> List[EncoderConfig]:
+        """Encoder settings to retry with after every entrant failed the gate.
+
+        With VMAF measured, the entrant closest to the gate is re-encoded
+        once, at the CRF that the VMAF/CRF slope predicts will clear
+        ``vmaf_threshold``. Otherwise every encoder is retried with its CRF
+        lowered by ``fallback_crf_reduction``.
+        """
+        scored = [
+            (metrics.vmaf, encoder)
+            for encoder, _, _, metrics, _ in encoder_results
+            if metrics.vmaf is not None
+        ]
+        if scored:
+            vmaf, encoder = max(scored, key=lambda item: item[0])
+            target = self.config.vmaf_threshold + _CRF_SEARCH_VMAF_MARGIN
+            estimate = math.floor(encoder.crf + (target - vmaf) / self.config.vmaf_crf_slope)
+            crf = max(0, encoder.crf - _CRF_SEARCH_MAX_STEP, min(encoder.crf - 1, estimate))
+            if crf >= encoder.crf:
+                return []
+            adjusted = [(encoder, crf)]
+        else:
+            adjusted = [
+                (encoder, max(0, encoder.crf - self.config.fallback_crf_reduction))
+                for encoder in self.config.enabled_encoders
+            ]
+
+        return [
+            EncoderConfig(
+                encoder_id=encoder.encoder_id,
+                preset=encoder.preset,
+                crf=crf,
+                tune=encoder.tune,
+                extra_params=encoder.extra_params,
             )
-            return vmaf_passes or psnr_ssim_passes
+            for encoder, crf in adjusted
+        ]
+
+    def _gate_checker(self) -> Callable[[PerceptualMetrics], bool]:
+        """Build the quality gate check for this pipeline's config.
+
+        The thresholds are bound into a closure specialized to the gate
+        mode instead of being looked up on the config for every encode.
+        ``run`` rebuilds it, so they are fixed for the length of a run.
+        """
+        vmaf_threshold = self.config.vmaf_threshold
+        psnr_threshold = self.config.psnr_threshold
+        ssim_threshold = self.config.ssim_threshold
+
+        if self.config.use_multi_metric:
+            def check_gate(metrics: PerceptualMetrics) -> bool:
+                # Multi-metric: VMAF passes OR (PSNR AND SSIM) pass
+                vmaf = metrics.vmaf
+                if vmaf is not None and vmaf >= vmaf_threshold:
+                    return True
+                psnr, ssim = metrics.psnr, metrics.ssim
+                return (
+                    psnr is not None and ssim is not None and
+                    psnr >= psnr_threshold and ssim >= ssim_threshold
+                )
         else:
-            # Single metric: all available metrics must pass
-            if metrics.vmaf is not None and metrics.vmaf < self.config.vmaf_threshold:
-                return False
-            if metrics.psnr is not None and metrics.psnr < self.config.psnr_threshold:
-                return False
-            if metrics.ssim is not None and metrics.ssim < self.config.ssim_threshold:
-                return False
-            return True
+            def check_gate(metrics: PerceptualMetrics) -> bool:
+                # Single metric: all available metrics must pass
+                vmaf, psnr, ssim = metrics.vmaf, metrics.psnr, metrics.ssim
+                return (
+                    (vmaf is None or vmaf >= vmaf_threshold) and
+                    (psnr is None or psnr >= psnr_threshold) and
+                    (ssim is None or ssim >= ssim_threshold)
+                )
+
+        return check_gate
 
 
 # Scenario definitions for integration tests
@@ -899,5 +1721,5 @@ def run_pipeline(input_path: str, output_path: str,
     Returns:
         PipelineResult with processing details
     """
-    pipeline = VideoPipeline(config)
-    return pipeline.run(input_path, output_path)
+    with VideoPipeline(config) as pipeline:
+        return pipeline.run(input_path, output_path)
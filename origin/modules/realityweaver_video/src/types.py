@@ -6,6 +6,7 @@
 Core types for RealityWeaverVideo pipeline.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Any, Optional, Tuple
@@ -34,6 +35,13 @@ class PerceptualMetrics:
     vmaf: Optional[float] = None
     psnr: Optional[float] = None
     ssim: Optional[float] = None
+    # Per-frame VMAF scores, when the metric run reports them; stored as
+    # float32 since long segments carry hundreds of thousands of frames
+    vmaf_per_frame: Optional[array] = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.vmaf_per_frame is not None and not isinstance(self.vmaf_per_frame, array):
+            self.vmaf_per_frame = array('f', self.vmaf_per_frame)
 
     @property
     def is_visually_lossless(self) -> bool:
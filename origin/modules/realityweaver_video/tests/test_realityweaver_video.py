@@ -7,8 +7,11 @@
 Test suite for RealityWeaverVideo pipeline.
 """
 
+import hashlib
 import json
 import os
+import shutil
+import subprocess
 import tempfile
 import unittest
 import sys
@@ -69,6 +72,13 @@ class TestPerceptualMetrics(unittest.TestCase):
         m = PerceptualMetrics(vmaf=80.0, psnr=46.0, ssim=0.998)
         self.assertTrue(m.is_visually_lossless)
 
+    def test_vmaf_per_frame_float32(self):
+        """Per-frame VMAF scores are stored as float32."""
+        m = PerceptualMetrics(vmaf=96.0, vmaf_per_frame=[95.5, 96.5])
+        self.assertEqual(m.vmaf_per_frame.typecode, 'f')
+        self.assertEqual(m.vmaf_per_frame.itemsize, 4)
+        self.assertEqual(list(m.vmaf_per_frame), [95.5, 96.5])
+
 
 class TestSegment(unittest.TestCase):
     """Test segment type."""
@@ -143,6 +153,139 @@ class TestVideoContainer(unittest.TestCase):
         self.assertEqual(len(c.segments), 1)
         self.assertEqual(c.segments[0].payload_size, 12)
 
+    def test_segment_lookup(self):
+        """Lookup by segment ID and by timestamp."""
+        c = VideoContainer()
+        for segment_id, start, end in [(1, 4.0, 8.0), (0, 0.0, 4.0), (2, 10.0, 12.0)]:
+            record = SegmentRecord(
+                segment_id=segment_id,
+                start_time=start,
+                end_time=end,
+                chosen_encoder_id="x264",
+                encoder_parameters={},
+                perceptual_metrics={},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c.add_segment(record, f"seg{segment_id}".encode())
+
+        self.assertEqual(c.get_segment_payload(0), b"seg0")
+        self.assertIsNone(c.get_segment_payload(3))
+        self.assertEqual(c.get_segment_by_time(0.0).segment_id, 0)
+        self.assertEqual(c.get_segment_by_time(5.5).segment_id, 1)
+        self.assertIsNone(c.get_segment_by_time(9.0))
+        self.assertIsNone(c.get_segment_by_time(-1.0))
+        self.assertIsNone(c.get_segment_by_time(12.0))
+
+    def _lookup_container(self, spans):
+        c = VideoContainer()
+        for segment_id, (start, end) in enumerate(spans):
+            record = SegmentRecord(
+                segment_id=segment_id,
+                start_time=start,
+                end_time=end,
+                chosen_encoder_id="x264",
+                encoder_parameters={},
+                perceptual_metrics={},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c.add_segment(record, f"seg{segment_id}".encode())
+        return c
+
+    def test_segment_lookup_overlapping(self):
+        """Overlapping segments resolve to the first one in list order."""
+        c = self._lookup_container([(0.0, 10.0), (2.0, 4.0), (5.0, 6.0)])
+        self.assertEqual(c.get_segment_by_time(3.0).segment_id, 0)
+        self.assertEqual(c.get_segment_by_time(5.5).segment_id, 0)
+        self.assertEqual(c.get_segment_by_time(8.0).segment_id, 0)
+        self.assertIsNone(c.get_segment_by_time(10.0))
+
+    def test_segment_lookup_equal_start(self):
+        """Segments sharing a start time resolve to the first containing one."""
+        c = self._lookup_container([(4.0, 6.0), (4.0, 8.0), (0.0, 4.0)])
+        self.assertEqual(c.get_segment_by_time(4.0).segment_id, 0)
+        self.assertEqual(c.get_segment_by_time(7.0).segment_id, 1)
+        self.assertEqual(c.get_segment_by_time(1.0).segment_id, 2)
+
+        c = self._lookup_container([(0.0, 4.0), (4.0, 4.0), (4.0, 8.0)])
+        self.assertEqual(c.get_segment_by_time(4.0).segment_id, 2)
+
+    def test_segment_lookup_after_direct_append(self):
+        """Segments appended to the list directly are still found."""
+        c = self._lookup_container([(0.0, 4.0)])
+        c.segments.append(SegmentRecord(
+            segment_id=7,
+            start_time=4.0,
+            end_time=8.0,
+            chosen_encoder_id="x264",
+            encoder_parameters={},
+            perceptual_metrics={},
+            payload_offset=0,
+            payload_size=4,
+        ))
+        self.assertEqual(c.get_segment_by_time(5.0).segment_id, 7)
+        self.assertEqual(c.get_segment_payload(7), b"seg0")
+
+    def test_segment_lookup_after_in_place_change(self):
+        """Segments replaced or edited in place are re-indexed."""
+        c = self._lookup_container([(0.0, 4.0), (4.0, 8.0), (8.0, 12.0)])
+        c.segments[1] = SegmentRecord(
+            segment_id=7,
+            start_time=4.0,
+            end_time=8.0,
+            chosen_encoder_id="x264",
+            encoder_parameters={},
+            perceptual_metrics={},
+            payload_offset=4,
+            payload_size=4,
+        )
+        self.assertEqual(c.get_segment_payload(7), b"seg1")
+        self.assertIsNone(c.get_segment_payload(1))
+        self.assertEqual(c.get_segment_by_time(5.0).segment_id, 7)
+
+        c.segments[0].segment_id = 9
+        self.assertEqual(c.get_segment_payload(9), b"seg0")
+        self.assertIsNone(c.get_segment_payload(0))
+
+        # Now overlapping segment 7, so the first match wins
+        c.segments[0].end_time = 6.0
+        self.assertEqual(c.get_segment_by_time(5.0).segment_id, 9)
+
+        c.segments[2].end_time = 20.0
+        with tempfile.NamedTemporaryFile(suffix='.rwvv', delete=False) as f:
+            path = f.name
+        try:
+            c.write(path)
+            self.assertEqual(VideoContainer.read(path).header.total_duration, 20.0)
+        finally:
+            os.unlink(path)
+
+    def test_write_duration_after_direct_append(self):
+        """The header duration covers segments appended to the list directly."""
+        c1 = self._lookup_container([(0.0, 4.0)])
+        c1.segments.append(SegmentRecord(
+            segment_id=1,
+            start_time=4.0,
+            end_time=9.5,
+            chosen_encoder_id="x264",
+            encoder_parameters={},
+            perceptual_metrics={},
+            payload_offset=0,
+            payload_size=4,
+        ))
+
+        with tempfile.NamedTemporaryFile(suffix='.rwvv', delete=False) as f:
+            path = f.name
+
+        try:
+            c1.write(path)
+            c2 = VideoContainer.read(path)
+            self.assertEqual(c2.header.total_duration, 9.5)
+            self.assertEqual(c2.get_segment_by_time(9.0).segment_id, 1)
+        finally:
+            os.unlink(path)
+
     def test_write_read_roundtrip(self):
         """Container write/read roundtrip."""
         c1 = VideoContainer()
@@ -174,6 +317,201 @@ class TestVideoContainer(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_write_read_segment_index(self):
+        """Segment index fields survive a write/read roundtrip."""
+        c1 = VideoContainer()
+        for i in range(3):
+            record = SegmentRecord(
+                segment_id=i,
+                start_time=i * 4.0,
+                end_time=(i + 1) * 4.0,
+                chosen_encoder_id="x264" if i % 2 else "x265",
+                encoder_parameters={"crf": 18 + i},
+                perceptual_metrics={"vmaf": 95.5, "psnr": 46.0} if i else {},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c1.add_segment(record, bytes([i]) * (i + 1))
+
+        with tempfile.NamedTemporaryFile(suffix='.rwvv', delete=False) as f:
+            path = f.name
+
+        try:
+            c1.write(path)
+            c2 = VideoContainer.read(path)
+
+            self.assertEqual(c2.header.total_duration, 12.0)
+            self.assertEqual([s.to_dict() for s in c2.segments],
+                             [s.to_dict() for s in c1.segments])
+            self.assertEqual(c2.get_segment_payload(2), b"\x02\x02\x02")
+        finally:
+            os.unlink(path)
+
+    def test_write_read_compact_index(self):
+        """Compact index roundtrips and is smaller than the fixed layout."""
+        c1 = VideoContainer()
+        for i in range(50):
+            record = SegmentRecord(
+                segment_id=i,
+                start_time=i * 2.0,
+                end_time=(i + 1) * 2.0,
+                chosen_encoder_id=["x264", "x265", "svt-av1"][i % 3],
+                encoder_parameters={"crf": 18 + i % 10},
+                perceptual_metrics={"vmaf": 90.0 + i / 10} if i % 4 else {},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c1.add_segment(record, bytes([i]) * (i % 7))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fixed_path = os.path.join(tmp, 'fixed.rwvv')
+            compact_path = os.path.join(tmp, 'compact.rwvv')
+            c1.write(fixed_path)
+            c1.write(compact_path, compact_index=True)
+            self.assertLess(os.path.getsize(compact_path), os.path.getsize(fixed_path))
+
+            c2 = VideoContainer.read(compact_path)
+            self.assertEqual([s.to_dict() for s in c2.segments],
+                             [s.to_dict() for s in c1.segments])
+            self.assertEqual(c2.get_segment_payload(13), bytes([13]) * 6)
+
+    def test_add_segment_from_path(self):
+        """File-backed payloads are copied into the container on write."""
+        with tempfile.TemporaryDirectory() as tmp:
+            seg_path = os.path.join(tmp, 'seg1.mp4')
+            with open(seg_path, 'wb') as f:
+                f.write(b"encoded segment one")
+
+            c1 = VideoContainer()
+            for i in range(2):
+                record = SegmentRecord(
+                    segment_id=i,
+                    start_time=i * 4.0,
+                    end_time=(i + 1) * 4.0,
+                    chosen_encoder_id="x264",
+                    encoder_parameters={},
+                    perceptual_metrics={},
+                    payload_offset=0,
+                    payload_size=0,
+                )
+                if i:
+                    c1.add_segment_from_path(record, seg_path)
+                else:
+                    c1.add_segment(record, b"segment zero")
+
+            self.assertEqual(c1.segments[1].payload_offset, 12)
+            self.assertEqual(c1.get_segment_payload(1), b"encoded segment one")
+            self.assertEqual(
+                c1.payload_sha256(),
+                hashlib.sha256(b"segment zeroencoded segment one").digest(),
+            )
+
+            out_path = os.path.join(tmp, 'out.rwvv')
+            c1.write(out_path)
+            c2 = VideoContainer.read(out_path)
+            self.assertEqual(c2.get_segment_payload(0), b"segment zero")
+            self.assertEqual(c2.get_segment_payload(1), b"encoded segment one")
+
+    def test_segment_payload_reads_owning_chunk(self):
+        """Looking up one segment never reads other segments' files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            container = VideoContainer()
+            for i in range(3):
+                seg_path = os.path.join(tmp, f'seg{i}.mp4')
+                with open(seg_path, 'wb') as f:
+                    f.write(bytes([i]) * (i + 5))
+                record = SegmentRecord(
+                    segment_id=i,
+                    start_time=i * 4.0,
+                    end_time=(i + 1) * 4.0,
+                    chosen_encoder_id="x264",
+                    encoder_parameters={},
+                    perceptual_metrics={},
+                    payload_offset=0,
+                    payload_size=0,
+                )
+                container.add_segment_from_path(record, seg_path)
+            container.add_segment(SegmentRecord(
+                segment_id=3,
+                start_time=12.0,
+                end_time=16.0,
+                chosen_encoder_id="x264",
+                encoder_parameters={},
+                perceptual_metrics={},
+                payload_offset=0,
+                payload_size=0,
+            ), b"in memory")
+
+            os.remove(os.path.join(tmp, 'seg0.mp4'))
+            self.assertEqual(container.get_segment_payload(2), bytes([2]) * 7)
+            self.assertEqual(container.get_segment_payload(3), b"in memory")
+
+    def test_rewrite_in_place(self):
+        """A container read from disk can be extended and written back."""
+        c1 = VideoContainer()
+        record = SegmentRecord(
+            segment_id=0,
+            start_time=0.0,
+            end_time=4.0,
+            chosen_encoder_id="x264",
+            encoder_parameters={},
+            perceptual_metrics={},
+            payload_offset=0,
+            payload_size=0,
+        )
+        c1.add_segment(record, b"first")
+
+        with tempfile.NamedTemporaryFile(suffix='.rwvv', delete=False) as f:
+            path = f.name
+
+        try:
+            c1.write(path)
+            c2 = VideoContainer.read(path)
+            record = SegmentRecord(
+                segment_id=1,
+                start_time=4.0,
+                end_time=8.0,
+                chosen_encoder_id="x264",
+                encoder_parameters={},
+                perceptual_metrics={},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c2.add_segment(record, b"second")
+            c2.write(path)
+
+            c3 = VideoContainer.read(path)
+            self.assertEqual(c3.get_segment_payload(0), b"first")
+            self.assertEqual(c3.get_segment_payload(1), b"second")
+        finally:
+            os.unlink(path)
+
+    def test_verify_integrity(self):
+        """Integrity check flags out-of-bounds and overlapping payloads."""
+        c = VideoContainer()
+        for i in range(3):
+            record = SegmentRecord(
+                segment_id=i,
+                start_time=i * 4.0,
+                end_time=(i + 1) * 4.0,
+                chosen_encoder_id="x264",
+                encoder_parameters={},
+                perceptual_metrics={},
+                payload_offset=0,
+                payload_size=0,
+            )
+            c.add_segment(record, b"data")
+        self.assertEqual(c.verify_integrity(), (True, []))
+
+        c.segments[1].payload_offset = 2
+        c.segments[2].payload_size = 10
+        ok, errors = c.verify_integrity()
+        self.assertFalse(ok)
+        self.assertEqual(errors, [
+            "Segment 2 payload extends beyond data",
+            "Segments 0 and 1 have overlapping payloads",
+        ])
+
     def test_manifest(self):
         """Get container manifest."""
         c = VideoContainer()
@@ -216,6 +554,215 @@ class TestPipeline(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("not found", result.error.lower())
 
+    def test_quality_gate(self):
+        """Multi-metric gates accept VMAF or PSNR+SSIM; single-metric gates
+        require every available metric."""
+        p = VideoPipeline()
+        self.assertTrue(p._check_gate(PerceptualMetrics(vmaf=96.0, psnr=30.0)))
+        self.assertTrue(p._check_gate(PerceptualMetrics(vmaf=80.0, psnr=46.0, ssim=0.998)))
+        self.assertFalse(p._check_gate(PerceptualMetrics(psnr=46.0)))
+
+        p = VideoPipeline(PipelineConfig(use_multi_metric=False))
+        self.assertTrue(p._check_gate(PerceptualMetrics(vmaf=96.0)))
+        self.assertFalse(p._check_gate(PerceptualMetrics(vmaf=96.0, psnr=30.0)))
+        self.assertTrue(p._check_gate(PerceptualMetrics()))
+
+    def test_quality_gate_follows_config(self):
+        """Config changes made after construction apply from the next run."""
+        p = VideoPipeline()
+        p.config.vmaf_threshold = 98.0
+        p.run("/nonexistent/file.mp4", "/tmp/out.mp4")
+        self.assertFalse(p._check_gate(PerceptualMetrics(vmaf=96.0)))
+
+        p.config = PipelineConfig(use_multi_metric=False, psnr_threshold=30.0)
+        p.run("/nonexistent/file.mp4", "/tmp/out.mp4")
+        self.assertTrue(p._check_gate(PerceptualMetrics(vmaf=96.0, psnr=35.0)))
+
+    def test_cuda_vmaf_disabled(self):
+        """GPU VMAF is skipped when disabled in the config."""
+        p = VideoPipeline(PipelineConfig(use_cuda_vmaf=False))
+        self.assertFalse(p._has_vmaf_cuda)
+
+    def test_worker_pool_reused(self):
+        """The segment pool persists across runs until closed."""
+        with VideoPipeline() as p:
+            pool = p._executor()
+            self.assertIs(p._executor(), pool)
+        self.assertIsNone(p._pool)
+
+    def test_duration_from_video_info(self):
+        """Duration comes from probed video info when available."""
+        p = VideoPipeline()
+        self.assertEqual(p._get_duration("x.mp4", {"format": {"duration": "12.5"}}), 12.5)
+
+    def test_parse_vmaf(self):
+        """VMAF comes from libvmaf's JSON log, else ffmpeg's logged score."""
+        p = VideoPipeline()
+        log = {
+            "frames": [{"metrics": {"vmaf": 96.0}}, {"metrics": {"vmaf": 98.0}}],
+            "pooled_metrics": {"vmaf": {"mean": 97.0}},
+        }
+        result = subprocess.CompletedProcess([], 0, json.dumps(log).encode(), b"")
+        m = PerceptualMetrics()
+        p._parse_vmaf(result, m)
+        self.assertEqual(m.vmaf, 97.0)
+        self.assertEqual(m.vmaf_per_frame.typecode, 'f')
+        self.assertEqual(list(m.vmaf_per_frame), [96.0, 98.0])
+
+        result = subprocess.CompletedProcess([], 0, b"", b"[Parsed_libvmaf_2] VMAF score: 93.5\n")
+        m = PerceptualMetrics()
+        p._parse_vmaf(result, m)
+        self.assertEqual(m.vmaf, 93.5)
+        self.assertIsNone(m.vmaf_per_frame)
+
+    def test_escalation_crf_estimate(self):
+        """A failed race is retried once at the CRF predicted to pass."""
+        p = VideoPipeline()
+        x264 = EncoderConfig(EncoderID.X264, crf=20)
+        x265 = EncoderConfig(EncoderID.X265, crf=22)
+        results = [
+            (x264, "a.mkv", 1.0, PerceptualMetrics(vmaf=93.0), 100),
+            (x265, "b.mkv", 1.0, PerceptualMetrics(vmaf=90.0), 80),
+        ]
+        candidates = p._escalation_candidates(results)
+        self.assertEqual(len(candidates), 1)
+        self.assertEqual(candidates[0].encoder_id, EncoderID.X264)
+        self.assertEqual(candidates[0].crf, 16)
+
+        # Without VMAF every encoder falls back to the fixed CRF reduction
+        results = [(x264, "a.mkv", 1.0, PerceptualMetrics(psnr=40.0), 100)]
+        self.assertEqual(
+            [c.crf for c in p._escalation_candidates(results)],
+            [c.crf - p.config.fallback_crf_reduction for c in p.config.enabled_encoders],
+        )
+
+    def test_fixed_segments(self):
+        """Fixed segmentation covers the duration with a short tail."""
+        p = VideoPipeline(PipelineConfig(segment_duration=4.0))
+        segments = p._create_segments_fixed(10.0)
+        self.assertEqual(
+            [(s.segment_id, s.start_time, s.end_time) for s in segments],
+            [(0, 0.0, 4.0), (1, 4.0, 8.0), (2, 8.0, 10.0)],
+        )
+        self.assertEqual(p._create_segments_fixed(0.0), [])
+
+    def test_shared_reference(self):
+        """The shared reference keeps the source pixel format and is only
+        decoded when the raw file fits."""
+        p = VideoPipeline(PipelineConfig(max_parallel_segments=2))
+        video = {"codec_type": "video", "width": 64, "height": 32,
+                 "r_frame_rate": "30/1", "pix_fmt": "yuv422p10le"}
+        p._get_video_info = lambda path: {"streams": [video]}
+        p._run_ffmpeg = lambda args: (True, "")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, "ref.yuv")
+            args = p._decode_reference("in.mp4", None, 4.0, out)
+            self.assertEqual(args[args.index("-pix_fmt") + 1], "yuv422p10le")
+
+            # 64x32 4:2:2 10-bit is 8 KiB a frame
+            free = shutil.disk_usage(tmp).free
+            duration = free / (8192 * 30) / 2 + 1
+            self.assertIsNone(p._decode_reference("in.mp4", None, duration, out))
+
+            video["pix_fmt"] = "nv12"
+            self.assertIsNone(p._decode_reference("in.mp4", None, 4.0, out))
+
+    def test_segment_input_args(self):
+        """Segments are seeked to with input options."""
+        p = VideoPipeline(PipelineConfig(ffmpeg_threads_per_invocation=2))
+        self.assertEqual(p._input_args("in.mp4"), ["-threads", "2", "-i", "in.mp4"])
+        s = Segment(segment_id=1, start_time=4.0, end_time=6.5)
+        self.assertEqual(
+            p._input_args("in.mp4", s),
+            ["-threads", "2", "-ss", "4.0", "-t", "2.5", "-i", "in.mp4"],
+        )
+
+    def test_ffmpeg_threads(self):
+        """Threads per ffmpeg default to an even share of the CPUs."""
+        p = VideoPipeline(PipelineConfig(max_parallel_segments=4))
+        self.assertEqual(
+            p._ffmpeg_threads_per_invocation(),
+            max(1, (os.cpu_count() or 4) // 4),
+        )
+        # Race entrants measured together split their segment's share
+        p._race_share.entrants = 3
+        self.assertEqual(
+            p._ffmpeg_threads_per_invocation(),
+            max(1, (os.cpu_count() or 12) // 12),
+        )
+        with self.assertRaises(ValueError):
+            PipelineConfig(ffmpeg_threads_per_invocation=0)
+        with self.assertRaises(ValueError):
+            PipelineConfig(max_parallel_segments=0)
+
+    def test_analysis_cache(self):
+        """Analysis results are reused until the input changes."""
+        calls = []
+
+        def analyze():
+            calls.append(1)
+            return {"scene": [0.0, 4.5], "motion": [[0.0, 0.5]]}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            p = VideoPipeline(PipelineConfig(analysis_cache_dir=os.path.join(tmp, "cache")))
+            path = os.path.join(tmp, "input.mp4")
+            with open(path, 'wb') as f:
+                f.write(b"video")
+
+            self.assertEqual(p._cached_analysis(path, "scene", analyze), [0.0, 4.5])
+            self.assertEqual(p._cached_analysis(path, "scene", analyze), [0.0, 4.5])
+            self.assertEqual(len(calls), 1)
+
+            with open(path, 'ab') as f:
+                f.write(b" changed")
+            p._cached_analysis(path, "scene", analyze)
+            self.assertEqual(len(calls), 2)
+
+            # Entries produced alongside the requested one are cached too
+            self.assertEqual(p._cached_analysis(path, "motion", analyze), [[0.0, 0.5]])
+            self.assertEqual(len(calls), 2)
+
+    def test_metrics_cache(self):
+        """Metrics are keyed by the reference and the encoded bytes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            p = VideoPipeline(PipelineConfig(analysis_cache_dir=tmp))
+            paths = {}
+            for name, data in [("ref", b"video"), ("a", b"enc"), ("b", b"enc"), ("c", b"other")]:
+                paths[name] = os.path.join(tmp, name + ".mkv")
+                with open(paths[name], 'wb') as f:
+                    f.write(data)
+
+            segment = Segment(segment_id=0, start_time=0.0, end_time=4.0)
+            key_a = p._metrics_cache_path(paths["ref"], paths["a"], segment)
+            self.assertEqual(key_a, p._metrics_cache_path(paths["ref"], paths["b"], segment))
+            self.assertNotEqual(key_a, p._metrics_cache_path(paths["ref"], paths["c"], segment))
+            self.assertNotEqual(key_a, p._metrics_cache_path(paths["ref"], paths["a"]))
+
+            os.makedirs(os.path.dirname(key_a))
+            with open(key_a, 'w') as f:
+                json.dump({"vmaf": 97.0, "psnr": 48.0, "ssim": 0.998}, f)
+            p._has_ffmpeg = True
+            metrics = p._compute_metrics(paths["ref"], paths["b"], segment)
+            self.assertEqual(metrics.vmaf, 97.0)
+            self.assertEqual(metrics.ssim, 0.998)
+
+            # A VMAF-only GPU result that ends the gate early is not cached:
+            # another gate mode or threshold would need PSNR/SSIM too
+            p._has_vmaf_cuda = True
+            p._compute_vmaf_cuda = lambda *args: PerceptualMetrics(vmaf=99.0)
+            metrics = p._compute_metrics(paths["ref"], paths["c"], segment)
+            self.assertEqual(metrics.vmaf, 99.0)
+            self.assertFalse(os.path.exists(
+                p._metrics_cache_path(paths["ref"], paths["c"], segment)
+            ))
+
+    def test_analysis_cache_opt_in(self):
+        """Nothing is cached unless a cache directory is configured."""
+        p = VideoPipeline()
+        self.assertIsNone(p.config.analysis_cache_dir)
+        self.assertIsNone(p._metrics_cache_path("ref.mkv", "enc.mkv"))
+
 
 class TestPipelineResult(unittest.TestCase):
     """Test pipeline result."""
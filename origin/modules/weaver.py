@@ -14,17 +14,65 @@ This module provides Origin-native integration points for:
 All functions follow Origin's determinism and fail-closed principles.
 """
 
+import functools
+import importlib
 import sys
 import os
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Tuple
 
-# Add module paths
+# Add module paths (appended, so the stdlib and site-packages keep
+# precedence over same-named Weaver modules such as ``types``)
 _module_base = os.path.dirname(os.path.abspath(__file__))
-for module_name in ['realityweaver', 'phraseweave', 'proofweave', 'realityweaver_video',
-                     'realityweaver_music']:
-    module_path = os.path.join(_module_base, module_name, 'src')
-    if module_path not in sys.path:
-        sys.path.insert(0, module_path)
+_existing_paths = set(sys.path)
+sys.path.extend(
+    module_path
+    for module_path in (
+        os.path.join(_module_base, module_name, 'src')
+        for module_name in ['realityweaver', 'phraseweave', 'proofweave', 'realityweaver_video',
+                            'realityweaver_music']
+    )
+    if module_path not in _existing_paths and os.path.isdir(module_path)
+)
+del _existing_paths
+
+
+# Resolved module attributes, keyed by ("<weaver>.<submodule>", attr)
+_IMPORTS: Dict[Tuple[str, str], Any] = {}
+
+# Weaver submodules that failed to import, so later calls fail fast
+_UNAVAILABLE: Dict[str, ImportError] = {}
+
+
+def _get(module: str, attr: str) -> Any:
+    """
+    Resolve an attribute of a Weaver module, importing it on first use.
+
+    ``module`` is "<weaver>.<submodule>", e.g. "realityweaver.container".
+    Inside the origin.modules package the submodule is imported by its full
+    name, so same-named modules of different Weavers (container, types)
+    stay distinct; standalone, it is imported from the paths above.
+    Later calls are a single dict lookup. A submodule that cannot be
+    imported is remembered, and later calls raise without searching the
+    import path again.
+    """
+    key = (module, attr)
+    value = _IMPORTS.get(key)
+    if value is None:
+        error = _UNAVAILABLE.get(module)
+        if error is not None:
+            raise ImportError(f"Weaver module {module!r} is not available: {error}") from error
+        weaver_name, submodule = module.split('.')
+        try:
+            if __package__:
+                mod = importlib.import_module(f'.{weaver_name}.src.{submodule}', __package__)
+            else:
+                mod = importlib.import_module(submodule)
+        except ImportError as exc:
+            _UNAVAILABLE[module] = exc
+            raise ImportError(f"Weaver module {module!r} is not available: {exc}") from exc
+        value = _IMPORTS[key] = getattr(mod, attr)
+    return value
 
 
 # =============================================================================
@@ -48,10 +96,8 @@ def compress_bytes(data: bytes, config: Optional[Dict[str, Any]] = None) -> byte
 
     Invariant: decompress_bytes(compress_bytes(x)) == x
     """
-    from container import compress_bytes as _compress, RWV1Config
-
     if config:
-        cfg = RWV1Config(
+        cfg = _get('realityweaver.types', 'RWV1Config')(
             block_size=config.get('block_size', 1 << 20),
             allow_bz2=config.get('allow_bz2', False),
             allow_lzma=config.get('allow_lzma', False),
@@ -60,7 +106,7 @@ def compress_bytes(data: bytes, config: Optional[Dict[str, Any]] = None) -> byte
     else:
         cfg = None
 
-    return _compress(data, cfg)
+    return _get('realityweaver.container', 'compress_bytes')(data, cfg)
 
 
 def decompress_bytes(container: bytes) -> bytes:
@@ -76,14 +122,41 @@ def decompress_bytes(container: bytes) -> bytes:
     Raises:
         Exception on decompression failure or integrity check failure
     """
-    from container import decompress_bytes as _decompress
-    return _decompress(container)
+    return _get('realityweaver.container', 'decompress_bytes')(container)
 
 
 # =============================================================================
 # PhraseWeave (PWV1) Integration
 # =============================================================================
 
+@functools.lru_cache(maxsize=16)
+def _phraseweave_dictionary(entries: Tuple[Tuple[int, bytes], ...]) -> Any:
+    """
+    Build a PhraseWeave Dictionary from (stan_id, raw_form) pairs.
+
+    Keyed by content, so repeated encode/decode calls with the same
+    dictionary reuse one object instead of rebuilding it. The codec only
+    reads it; its tables are made read-only so the shared object cannot
+    be changed for later calls.
+    """
+    dict_obj = _get('phraseweave.dictionary', 'Dictionary')()
+    for stan_id, raw_form in entries:
+        dict_obj.add_entry(stan_id, raw_form)
+    dict_obj.entries = MappingProxyType(dict_obj.entries)
+    dict_obj.phrases = MappingProxyType(dict_obj.phrases)
+    return dict_obj
+
+
+def _dictionary_entries(dictionary: Optional[Dict[int, bytes]]) -> Tuple[Tuple[int, bytes], ...]:
+    """Hashable form of a caller's stan_id -> raw_form dict (str forms are UTF-8 encoded)."""
+    if not dictionary:
+        return ()
+    return tuple(
+        (stan_id, raw_form.encode() if isinstance(raw_form, str) else bytes(raw_form))
+        for stan_id, raw_form in dictionary.items()
+    )
+
+
 def phraseweave_encode(
     raw: bytes,
     dictionary: Optional[Dict[int, bytes]] = None,
@@ -105,24 +178,16 @@ def phraseweave_encode(
 
     Invariant: phraseweave_decode(phraseweave_encode(x)[0]) == x
     """
-    from codec import phraseweave_encode as _encode
-    from dictionary import Dictionary
-    from types import Config
-
-    # Build dictionary
-    dict_obj = Dictionary()
-    if dictionary:
-        for stan_id, raw_form in dictionary.items():
-            dict_obj.add_entry(stan_id, raw_form)
+    dict_obj = _phraseweave_dictionary(_dictionary_entries(dictionary))
 
     # Build config
-    cfg = Config(
+    cfg = _get('phraseweave.types', 'Config')(
         min_phrase_len=config.get('min_phrase_len', 2) if config else 2,
         max_phrase_len=config.get('max_phrase_len', 64) if config else 64,
         greedy=config.get('greedy', True) if config else True,
     )
 
-    woven, metadata = _encode(raw, dict_obj, cfg)
+    woven, metadata = _get('phraseweave.codec', 'phraseweave_encode')(raw, dict_obj, cfg)
     return woven, metadata.to_dict()
 
 
@@ -146,22 +211,14 @@ def phraseweave_decode(
     Raises:
         Exception on decoding failure or dictionary mismatch
     """
-    from codec import phraseweave_decode as _decode
-    from dictionary import Dictionary
-    from types import Config
-
-    # Build dictionary
-    dict_obj = Dictionary()
-    if dictionary:
-        for stan_id, raw_form in dictionary.items():
-            dict_obj.add_entry(stan_id, raw_form)
+    dict_obj = _phraseweave_dictionary(_dictionary_entries(dictionary))
 
     # Build config
-    cfg = Config(
+    cfg = _get('phraseweave.types', 'Config')(
         max_output_size=config.get('max_output_size') if config else None,
     )
 
-    return _decode(woven, dict_obj, cfg)
+    return _get('phraseweave.codec', 'phraseweave_decode')(woven, dict_obj, cfg)
 
 
 # =============================================================================
@@ -184,9 +241,7 @@ def pwk_check(pwof: Dict[str, Any]) -> Dict[str, Any]:
 
     The kernel is TRUSTED. Everything else (engines, tactics, LLMs) is UNTRUSTED.
     """
-    from kernel import pwk_check as _check
-
-    result = _check(pwof)
+    result = _get('proofweave.kernel', 'pwk_check')(pwof)
     return {
         'passed': result.passed,
         'message': result.message,
@@ -206,8 +261,7 @@ def pwof_hash(pwof: Dict[str, Any], algorithm: str = 'sha256') -> str:
     Returns:
         Hex-encoded hash string
     """
-    from canonicalize import compute_hash
-    return compute_hash(pwof, algorithm)
+    return _get('proofweave.canonicalize', 'compute_hash')(pwof, algorithm)
 
 
 # =============================================================================
@@ -241,17 +295,15 @@ def rwv_video_run_pipeline(
     Note: This is a skeleton implementation. Full functionality requires
     ffmpeg and metric computation tools.
     """
-    from pipeline import VideoPipeline, PipelineConfig
-
     if config:
-        cfg = PipelineConfig(
+        cfg = _get('realityweaver_video.pipeline', 'PipelineConfig')(
             segment_duration=config.get('segment_duration', 4.0),
             vmaf_threshold=config.get('vmaf_threshold', 95.0),
         )
     else:
         cfg = None
 
-    pipeline = VideoPipeline(cfg)
+    pipeline = _get('realityweaver_video.pipeline', 'VideoPipeline')(cfg)
     result = pipeline.run(input_path, output_path)
 
     return result.to_dict()
@@ -287,14 +339,14 @@ def rxm_pack_bytes(
     Invariant: rxm_unpack_bytes(rxm_pack_bytes(meta, score, audio, sync))
                reproduces all inputs.
     """
-    from container import pack_bytes as _pack
-    from rxm_types import RXMMetadata, RXMConfig, SyncEntry
+    RXMMetadata = _get('realityweaver_music.rxm_types', 'RXMMetadata')
+    SyncEntry = _get('realityweaver_music.rxm_types', 'SyncEntry')
 
     meta = RXMMetadata.from_dict(metadata) if metadata else RXMMetadata()
 
     cfg = None
     if config:
-        cfg = RXMConfig(
+        cfg = _get('realityweaver_music.rxm_types', 'RXMConfig')(
             include_sha256=config.get('include_sha256', False),
             rwv1_block_size=config.get('rwv1_block_size', 1 << 20),
             rwv1_allow_bz2=config.get('rwv1_allow_bz2', False),
@@ -306,7 +358,7 @@ def rxm_pack_bytes(
         sync = [SyncEntry(score_tick=e[0], audio_frame=e[1])
                 for e in sync_entries]
 
-    return _pack(meta, score_data, audio_data, sync, cfg)
+    return _get('realityweaver_music.container', 'pack_bytes')(meta, score_data, audio_data, sync, cfg)
 
 
 def rxm_unpack_bytes(container: bytes) -> Dict[str, Any]:
@@ -323,9 +375,7 @@ def rxm_unpack_bytes(container: bytes) -> Dict[str, Any]:
             - audio_data: bytes or None
             - sync_entries: list of [tick, frame] pairs or None
     """
-    from container import unpack_bytes as _unpack
-
-    result = _unpack(container)
+    result = _get('realityweaver_music.container', 'unpack_bytes')(container)
     return {
         'metadata': result['metadata'].to_dict(),
         'score_data': result['score_data'],
@@ -5,8 +5,10 @@ OI-FAR CLI - Ongoing-Intelligence Frontier Approximation Runtime.
 Usage:
     oi_far run "query"           Run a single query
     oi_far run -b "query"        Run in bridge mode (structured output)
+    oi_far run --server          Answer one query per stdin line as JSON lines
     oi_far eval                  Run evaluation suite
     oi_far eval --prompts FILE   Run specific prompts
+    oi_far eval --determinism-runs 0   Skip the repeat-run determinism check
     oi_far ingest FILE           Ingest a document
     oi_far growth                Show growth metrics
     oi_far search "query"        Search the vault
@@ -18,12 +20,14 @@ Usage:
 import argparse
 import hashlib
 import json
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .kernel import SessionState, OIKernel
-from .substrate import BrickCompiler, BrickStore, Document, DocumentStore
+from .substrate import Brick, BrickCompiler, BrickStore, Document, DocumentStore
 from .retrieval import DeterministicRetriever
 from .reasoning import DeterministicCritic, DeterministicPlanner, DeterministicSolver
 from .renderer import DeterministicRenderer, RenderConfig, RenderMode
@@ -82,9 +86,8 @@ class OIFarRuntime:
         self.planner = DeterministicPlanner()
         self.solver = DeterministicSolver()
         self.critic = DeterministicCritic()
-        self.renderer = DeterministicRenderer(
-            config=RenderConfig(mode=mode)
-        )
+        self._render_config = RenderConfig(mode=mode)
+        self.renderer = DeterministicRenderer(config=self._render_config)
 
         # Initialize session via kernel
         self.kernel = OIKernel()
@@ -127,37 +130,57 @@ class OIFarRuntime:
         if self.brick_store.count() > 0:
             return
 
-        for pack_dir in sorted(packs_dir.iterdir()):
-            if not pack_dir.is_dir():
-                continue
-
-            pack_yaml = pack_dir / "pack.yaml"
-            if not pack_yaml.exists():
-                continue
-
+        # DirEntry.is_dir() answers from the directory listing, no stat per pack
+        with os.scandir(packs_dir) as entries:
+            pack_dirs = sorted(entry.path for entry in entries if entry.is_dir())
+        pack_yamls = [
+            Path(pack_dir, "pack.yaml")
+            for pack_dir in pack_dirs
+            if os.path.isfile(os.path.join(pack_dir, "pack.yaml"))
+        ]
+
+        # libyaml's loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        def read_pack(pack_yaml: Path) -> tuple[str, dict]:
+            raw = pack_yaml.read_text(encoding="utf-8")
+            return raw, yaml.load(raw, Loader=loader)
+
+        # Read and parse packs concurrently; compile stays sequential and in
+        # sorted order because brick IDs come from the compiler's counters.
+        with ThreadPoolExecutor(max_workers=min(32, len(pack_yamls) or 1)) as executor:
+            pending = [executor.submit(read_pack, pack_yaml) for pack_yaml in pack_yamls]
+
+        documents: list[Document] = []
+        bricks: list[Brick] = []
+        for pack_yaml, future in zip(pack_yamls, pending):
+            pack_dir = pack_yaml.parent
             try:
-                with open(pack_yaml) as f:
-                    pack_data = yaml.safe_load(f)
+                raw, pack_data = future.result()
 
                 # Create document
                 doc = Document(
                     id=f"pack_{pack_data.get('id', pack_dir.name)}",
                     title=pack_data.get("title", pack_dir.name),
-                    content=yaml.dump(pack_data),
+                    content=raw,
                     source_type="pack",
                     source_path=str(pack_yaml),
                     metadata=pack_data,
                 )
 
-                # Store and compile
-                self.document_store.add(doc)
-                bricks = self.brick_compiler.compile_document(doc)
-                for brick in bricks:
-                    self.brick_store.add(brick)
+                # Compile now, store in one batch below; the hash is set
+                # first because compiled provenance copies it
+                doc.compute_hash()
+                documents.append(doc)
+                bricks.extend(self.brick_compiler.compile_document(doc))
 
             except Exception as e:
                 print(f"Warning: Failed to load {pack_yaml}: {e}", file=sys.stderr)
 
+        # Persist each store once rather than after every insert
+        self.document_store.add_many(documents)
+        self.brick_store.add_many(bricks)
+
         # Rebuild indexes
         self.brick_store.rebuild_indexes()
         self.document_store.rebuild_index()
@@ -172,7 +195,7 @@ class OIFarRuntime:
         Returns:
             Result dictionary with output and metadata
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Update session
         self.kernel.begin_turn(query)
@@ -210,15 +233,14 @@ class OIFarRuntime:
             )
 
         # 7. Render
-        render_config = RenderConfig(mode=self.mode)
-        output = self.renderer.render(answer_plan, render_config)
+        output = self.renderer.render(answer_plan, self._render_config)
 
         # Update session
         self._history.append(("assistant", output.text))
         output_hash = hashlib.sha256(output.text.encode()).hexdigest()[:16]
         self.kernel.end_turn(success=True, output_hash=output_hash)
 
-        total_time = time.time() - start_time
+        total_ns = time.perf_counter_ns() - start_ns
 
         return {
             "output": output.text,
@@ -229,7 +251,7 @@ class OIFarRuntime:
             "new_claims_check": output.new_claims_check_passed,
             "mode": output.mode.value,
             "timing": {
-                "total_ms": total_time * 1000,
+                "total_ms": total_ns / 1_000_000,
                 "reasoning_ms": answer_plan.reasoning_time_ms,
             },
             "deterministic": True,
@@ -241,6 +263,12 @@ class OIFarRuntime:
         return result.to_dict()
 
 
+def _print_json(data) -> None:
+    """Stream data to stdout as indented JSON."""
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -253,13 +281,17 @@ def main():
 
     # Run command
     run_parser = subparsers.add_parser("run", help="Run a query")
-    run_parser.add_argument("query", help="Query to run")
+    run_parser.add_argument("query", nargs="?",
+                          help="Query to run (omit with --server)")
     run_parser.add_argument("-b", "--bridge", action="store_true",
                           help="Use bridge mode (structured output)")
     run_parser.add_argument("-v", "--verbose", action="store_true",
                           help="Verbose output with metadata")
     run_parser.add_argument("--vault", default=".",
                           help="Path to vault (default: current directory)")
+    run_parser.add_argument("--server", action="store_true",
+                          help="Keep one runtime loaded and answer one query per "
+                               "stdin line, writing one JSON result per line")
 
     # Search command
     search_parser = subparsers.add_parser("search", help="Search the vault")
@@ -272,6 +304,9 @@ def main():
     # Eval command
     eval_parser = subparsers.add_parser("eval", help="Run evaluation suite")
     eval_parser.add_argument("--prompts", help="Path to prompts file")
+    eval_parser.add_argument("--determinism-runs", type=int, default=2,
+                            help="Repeat runs per prompt for the determinism "
+                                 "check (0 skips it; default: 2)")
     eval_parser.add_argument("--vault", default=".",
                             help="Path to vault")
 
@@ -318,12 +353,22 @@ def main():
     # Handle commands
     if args.command == "run":
         mode = RenderMode.BRIDGE if args.bridge else RenderMode.GALLEY
+        if not args.server and args.query is None:
+            run_parser.error("a query is required unless --server is given")
         runtime = OIFarRuntime(vault_path=vault_path, mode=mode)
 
+        if args.server:
+            for line in sys.stdin:
+                query = line.strip()
+                if not query:
+                    continue
+                print(json.dumps(runtime.run(query)), flush=True)
+            return
+
         result = runtime.run(args.query)
 
         if args.verbose:
-            print(json.dumps(result, indent=2))
+            _print_json(result)
         else:
             print(result["output"])
 
@@ -352,7 +397,11 @@ def main():
         if not prompts_path:
             prompts_path = vault_path / "eval" / "prompts"
 
-        result = run_evaluation(vault_path, prompts_path)
+        result = run_evaluation(
+            vault_path,
+            prompts_path,
+            check_determinism_runs=args.determinism_runs,
+        )
 
         print(f"Evaluation Results:")
         print(f"  Total: {result['total']}")
@@ -373,7 +422,7 @@ def main():
             print("Run more queries and evaluations first.")
         else:
             print("Growth Metrics:")
-            print(json.dumps(metrics, indent=2))
+            _print_json(metrics)
 
         recommendations = runtime.growth_loop.get_growth_recommendations()
         if recommendations:
@@ -397,7 +446,7 @@ def main():
             )
             response = proxy.process(request)
             if args.json:
-                print(json.dumps(response.to_dict(), indent=2))
+                _print_json(response.to_dict())
             else:
                 print(response)
 
@@ -411,7 +460,7 @@ def main():
                 "response": response.to_dict(),
             })
         if args.json:
-            print(json.dumps(responses, indent=2))
+            _print_json(responses)
         else:
             for item in responses:
                 print(f"Q: {item['question']}")
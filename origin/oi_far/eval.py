@@ -2,12 +2,19 @@
 
 import hashlib
 import json
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
 
 
 @dataclass
@@ -35,6 +42,25 @@ class EvalResult:
     error: str | None = None
 
 
+# libyaml's loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed prompt files: path -> (content digest, YAML data)
+_PROMPT_FILE_CACHE: dict[Path, tuple[bytes, Any]] = {}
+
+
+def _load_prompt_file(file_path: Path) -> Any:
+    """Parse a prompt file, reusing the last parse while its content is unchanged."""
+    raw = file_path.read_bytes()
+    digest = hashlib.sha256(raw).digest()
+    cached = _PROMPT_FILE_CACHE.get(file_path)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    data = yaml.load(raw, Loader=_YAML_LOADER)
+    _PROMPT_FILE_CACHE[file_path] = (digest, data)
+    return data
+
+
 def load_prompts(prompts_path: str | Path) -> list[EvalPrompt]:
     """Load evaluation prompts from YAML files."""
     prompts_path = Path(prompts_path)
@@ -49,8 +75,7 @@ def load_prompts(prompts_path: str | Path) -> list[EvalPrompt]:
 
     for file_path in sorted(files):
         try:
-            with open(file_path) as f:
-                data = yaml.safe_load(f)
+            data = _load_prompt_file(file_path.resolve())
 
             if isinstance(data, list):
                 for item in data:
@@ -59,9 +84,10 @@ def load_prompts(prompts_path: str | Path) -> list[EvalPrompt]:
                         category=item.get("category", file_path.stem),
                         prompt=item["prompt"],
                         expected_behavior=item.get("expected_behavior", "answer"),
-                        expected_contains=item.get("expected_contains", []),
-                        expected_not_contains=item.get("expected_not_contains", []),
-                        tags=item.get("tags", []),
+                        # Copies, so prompts never share lists with the cache
+                        expected_contains=list(item.get("expected_contains") or ()),
+                        expected_not_contains=list(item.get("expected_not_contains") or ()),
+                        tags=list(item.get("tags") or ()),
                     ))
         except Exception as e:
             print(f"Warning: Failed to load {file_path}: {e}")
@@ -113,10 +139,72 @@ def check_determinism(
     return True
 
 
+def _evaluate_prompt(runtime, prompt: EvalPrompt, determinism_runs: int) -> EvalResult:
+    """Run one prompt, check its output and its determinism."""
+    try:
+        start = time.time()
+        result = runtime.run(prompt.prompt)
+        timing = (time.time() - start) * 1000
+
+        output = result["output"]
+        status = result["status"]
+
+        # Check output
+        checks = check_output(output, status, prompt)
+
+        # Check determinism
+        is_deterministic = check_determinism(
+            runtime, prompt, output, determinism_runs
+        )
+
+        # Determine pass/fail
+        passed = all(checks.values()) and is_deterministic
+
+        return EvalResult(
+            prompt_id=prompt.id,
+            passed=passed,
+            output=output,
+            status=status,
+            checks=checks,
+            deterministic=is_deterministic,
+            timing_ms=timing,
+        )
+
+    except Exception as e:
+        return EvalResult(
+            prompt_id=prompt.id,
+            passed=False,
+            output="",
+            status="error",
+            checks={},
+            deterministic=False,
+            timing_ms=0,
+            error=str(e),
+        )
+
+
+# Runtime of an evaluation worker process, set by _init_eval_worker
+_worker_runtime = None
+
+
+def _init_eval_worker(vault_path: Path) -> None:
+    """Build the runtime this worker process evaluates prompts with."""
+    global _worker_runtime
+    from .cli import OIFarRuntime
+
+    _worker_runtime = OIFarRuntime(vault_path=vault_path)
+
+
+def _evaluate_prompt_in_worker(prompt: EvalPrompt, determinism_runs: int) -> EvalResult:
+    """Evaluate a prompt with this worker's runtime."""
+    return _evaluate_prompt(_worker_runtime, prompt, determinism_runs)
+
+
 def run_evaluation(
     vault_path: str | Path,
     prompts_path: str | Path | None = None,
     check_determinism_runs: int = 2,
+    workers: int | None = None,
 ) -> dict[str, Any]:
     """
     Run full evaluation suite.
@@ -125,6 +213,8 @@ def run_evaluation(
         vault_path: Path to vault
         prompts_path: Path to prompts (file or directory)
         check_determinism_runs: Number of runs for determinism check
+        workers: Worker processes for the prompt loop (default: CPU count;
+            1 runs serially in this process)
 
     Returns:
         Evaluation results dictionary
@@ -150,52 +240,32 @@ def run_evaluation(
             "error": "No prompts found",
         }
 
-    results: list[EvalResult] = []
-    determinism_passed = True
-
-    for prompt in prompts:
-        try:
-            start = time.time()
-            result = runtime.run(prompt.prompt)
-            timing = (time.time() - start) * 1000
-
-            output = result["output"]
-            status = result["status"]
-
-            # Check output
-            checks = check_output(output, status, prompt)
-
-            # Check determinism
-            is_deterministic = check_determinism(
-                runtime, prompt, output, check_determinism_runs
-            )
-            if not is_deterministic:
-                determinism_passed = False
-
-            # Determine pass/fail
-            passed = all(checks.values()) and is_deterministic
-
-            results.append(EvalResult(
-                prompt_id=prompt.id,
-                passed=passed,
-                output=output,
-                status=status,
-                checks=checks,
-                deterministic=is_deterministic,
-                timing_ms=timing,
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(prompts))
+
+    if workers > 1 and len(prompts) >= 4:
+        # The parent runtime above has already bootstrapped and persisted the
+        # stores, so each worker only loads them from disk.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_eval_worker,
+            initargs=(vault_path,),
+        ) as executor:
+            results = list(executor.map(
+                _evaluate_prompt_in_worker,
+                prompts,
+                repeat(check_determinism_runs),
+                chunksize=max(1, len(prompts) // (4 * workers)),
             ))
+    else:
+        results = [
+            _evaluate_prompt(runtime, prompt, check_determinism_runs)
+            for prompt in prompts
+        ]
 
-        except Exception as e:
-            results.append(EvalResult(
-                prompt_id=prompt.id,
-                passed=False,
-                output="",
-                status="error",
-                checks={},
-                deterministic=False,
-                timing_ms=0,
-                error=str(e),
-            ))
+    # Prompts that raised count as failed, not as nondeterministic
+    determinism_passed = all(r.deterministic for r in results if r.error is None)
 
     # Calculate metrics
     total = len(results)
@@ -269,10 +339,14 @@ def generate_golden_outputs(
             "confidence": result["confidence"],
         }
 
-    # Save golden outputs
+    # Save golden outputs (serialized with orjson when installed)
     golden_file = output_path / "golden_outputs.json"
-    with open(golden_file, "w") as f:
-        json.dump(golden, f, indent=2, sort_keys=True)
+    if orjson is not None:
+        with open(golden_file, "wb") as f:
+            f.write(orjson.dumps(golden, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(golden_file, "w") as f:
+            json.dump(golden, f, indent=2, sort_keys=True)
 
     return {
         "total": len(golden),
@@ -300,8 +374,11 @@ def verify_against_golden(
     if not golden_file.exists():
         return {"error": "Golden outputs not found", "passed": False}
 
-    with open(golden_file) as f:
-        golden = json.load(f)
+    if orjson is not None:
+        golden = orjson.loads(golden_file.read_bytes())
+    else:
+        with open(golden_file) as f:
+            golden = json.load(f)
 
     runtime = OIFarRuntime(vault_path=vault_path)
     prompts = load_prompts(prompts_path)
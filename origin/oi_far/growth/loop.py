@@ -1,10 +1,16 @@
 """OI Capability Growth Loop."""
 
+import heapq
 import json
 import time
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
 
 from ..reasoning.types import AnswerStatus, CriticResult
 from ..retrieval.types import ContextPack
@@ -306,31 +312,37 @@ class GrowthLoop:
 
     def get_growth_recommendations(self) -> list[dict[str, Any]]:
         """Get recommendations for what to add next."""
-        recommendations = []
+        # Both lists come back sorted by priority; merging them (missing
+        # knowledge first on ties) yields the top 10 without building and
+        # re-sorting a recommendation for every high-priority entry.
+        top = islice(
+            heapq.merge(
+                self.tracker.get_high_priority_missing(),
+                self.tracker.get_high_priority_sources(),
+                key=lambda item: -item.priority,
+            ),
+            10,
+        )
 
-        # High priority missing knowledge
-        for m in self.tracker.get_high_priority_missing():
-            recommendations.append({
-                "type": "missing_knowledge",
-                "priority": m.priority,
-                "topic": m.topic,
-                "description": m.description,
-                "action": f"Add knowledge about: {m.topic}",
-            })
-
-        # High priority sources
-        for s in self.tracker.get_high_priority_sources():
-            recommendations.append({
-                "type": "needed_source",
-                "priority": s.priority,
-                "description": s.description,
-                "action": f"Ingest: {s.suggested_search or s.description}",
-            })
-
-        # Sort by priority
-        recommendations.sort(key=lambda r: -r["priority"])
-
-        return recommendations[:10]  # Top 10
+        recommendations = []
+        for item in top:
+            if isinstance(item, MissingKnowledge):
+                recommendations.append({
+                    "type": "missing_knowledge",
+                    "priority": item.priority,
+                    "topic": item.topic,
+                    "description": item.description,
+                    "action": f"Add knowledge about: {item.topic}",
+                })
+            else:
+                recommendations.append({
+                    "type": "needed_source",
+                    "priority": item.priority,
+                    "description": item.description,
+                    "action": f"Ingest: {item.suggested_search or item.description}",
+                })
+
+        return recommendations
 
     def _save_state(self) -> None:
         """Save growth loop state to disk."""
@@ -345,7 +357,12 @@ class GrowthLoop:
             "metrics": self.get_improvement_metrics(),
         }
 
+        # Serialized with orjson when installed
         state_path = self.storage_path / "growth_state.json"
+        if orjson is not None:
+            with open(state_path, "wb") as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
         with open(state_path, "w") as f:
             json.dump(state, f, indent=2)
 
@@ -359,8 +376,11 @@ class GrowthLoop:
             return False
 
         try:
-            with open(state_path) as f:
-                state = json.load(f)
+            if orjson is not None:
+                state = orjson.loads(state_path.read_bytes())
+            else:
+                with open(state_path) as f:
+                    state = json.load(f)
 
             # Restore iterations
             self.iterations = [
@@ -1,5 +1,6 @@
 """Missing knowledge and needed sources tracking."""
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -14,7 +15,7 @@ class MissingKind(Enum):
     PROOF = "proof"  # Missing proof/derivation
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingKnowledge:
     """A piece of missing knowledge identified during processing."""
     kind: MissingKind
@@ -35,7 +36,7 @@ class MissingKnowledge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NeededSource:
     """A source document that would improve coverage."""
     source_type: str  # "document", "paper", "definition", "example"
@@ -54,7 +55,7 @@ class NeededSource:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RegressionTest:
     """A regression test generated from a failure."""
     test_id: str
@@ -164,12 +165,11 @@ class MissingKnowledgeTracker:
 
     def aggregate_by_topic(self) -> dict[str, list[MissingKnowledge]]:
         """Aggregate missing knowledge by topic."""
-        by_topic: dict[str, list[MissingKnowledge]] = {}
+        # Scanned on each call so edits made directly to self.missing count
+        by_topic: defaultdict[str, list[MissingKnowledge]] = defaultdict(list)
         for m in self.missing:
-            if m.topic not in by_topic:
-                by_topic[m.topic] = []
             by_topic[m.topic].append(m)
-        return by_topic
+        return dict(by_topic)
 
     def export(self) -> dict:
         """Export all tracked data."""
@@ -11,7 +11,7 @@ class RenderMode(Enum):
     BRIDGE = "bridge"  # Structured with headings/checklists
 
 
-@dataclass
+@dataclass(frozen=True)
 class RenderConfig:
     """Configuration for rendering."""
     mode: RenderMode = RenderMode.GALLEY
@@ -14,6 +14,14 @@ from .types import (
     Document,
 )
 
+# Text extraction patterns, compiled once at import
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_BULLET_PATTERN = re.compile(r'^[\-\*\•]\s+(.+)$', re.MULTILINE)
+_NUMBER_PATTERN = re.compile(r'^\d+[\.\)]\s+(.+)$', re.MULTILINE)
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_IS_PATTERN = re.compile(r'([A-Z][a-zA-Z\s]+)\s+is\s+(.+?)\.', re.IGNORECASE)
+_COLON_PATTERN = re.compile(r'^([A-Z][a-zA-Z\s]+):\s+(.+)$', re.MULTILINE)
+
 
 class BrickCompiler:
     """
@@ -203,8 +211,7 @@ class BrickCompiler:
         sections = []
 
         # Match markdown headings
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        matches = list(heading_pattern.finditer(text))
+        matches = list(_HEADING_PATTERN.finditer(text))
 
         if not matches:
             # No headings, treat whole text as one section
@@ -226,10 +233,7 @@ class BrickCompiler:
         claims = []
 
         # Look for bullet points and numbered lists
-        bullet_pattern = re.compile(r'^[\-\*\•]\s+(.+)$', re.MULTILINE)
-        number_pattern = re.compile(r'^\d+[\.\)]\s+(.+)$', re.MULTILINE)
-
-        for pattern in [bullet_pattern, number_pattern]:
+        for pattern in (_BULLET_PATTERN, _NUMBER_PATTERN):
             for match in pattern.finditer(text):
                 self._claim_counter += 1
                 claim_text = match.group(1).strip()
@@ -242,7 +246,7 @@ class BrickCompiler:
 
         # If no bullet points, extract sentences that look like claims
         if not claims:
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            sentences = _SENTENCE_SPLIT_PATTERN.split(text)
             for sentence in sentences[:5]:  # Limit to first 5
                 sentence = sentence.strip()
                 if len(sentence) > 20 and len(sentence) < 300:
@@ -260,9 +264,7 @@ class BrickCompiler:
         definitions = []
 
         # Look for "X is Y" patterns
-        is_pattern = re.compile(r'([A-Z][a-zA-Z\s]+)\s+is\s+(.+?)\.', re.IGNORECASE)
-
-        for match in is_pattern.finditer(text):
+        for match in _IS_PATTERN.finditer(text):
             term = match.group(1).strip()
             definition = match.group(2).strip()
             if len(term) < 50 and len(definition) > 10:
@@ -272,9 +274,7 @@ class BrickCompiler:
                 ))
 
         # Look for "X: Y" patterns (definition style)
-        colon_pattern = re.compile(r'^([A-Z][a-zA-Z\s]+):\s+(.+)$', re.MULTILINE)
-
-        for match in colon_pattern.finditer(text):
+        for match in _COLON_PATTERN.finditer(text):
             term = match.group(1).strip()
             definition = match.group(2).strip()
             if len(term) < 50 and len(definition) > 10:
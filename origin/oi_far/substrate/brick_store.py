@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from .types import Brick, BrickKind, Claim, Link
 from .indexes.lexical import LexicalIndex, LexicalHit
@@ -94,17 +94,37 @@ class BrickStore:
         Returns:
             Brick ID
         """
-        # Remove old version if exists
-        if brick.id in self._bricks:
-            self._unindex_brick(self._bricks[brick.id])
-
-        self._index_brick(brick)
+        self._replace_brick(brick)
 
         if self.storage_path:
             self._save_to_disk()
 
         return brick.id
 
+    def add_many(self, bricks: Iterable[Brick]) -> list[str]:
+        """
+        Add several bricks, persisting once instead of after each one.
+
+        Returns:
+            Brick IDs in input order
+        """
+        brick_ids = []
+        for brick in bricks:
+            self._replace_brick(brick)
+            brick_ids.append(brick.id)
+
+        if self.storage_path and brick_ids:
+            self._save_to_disk()
+
+        return brick_ids
+
+    def _replace_brick(self, brick: Brick) -> None:
+        """Index a brick, removing any old version with the same ID."""
+        if brick.id in self._bricks:
+            self._unindex_brick(self._bricks[brick.id])
+
+        self._index_brick(brick)
+
     def get(self, brick_id: str) -> Brick | None:
         """Get brick by ID."""
         return self._bricks.get(brick_id)
@@ -4,7 +4,7 @@ import hashlib
 import json
 import os
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 try:
     import yaml
 except ImportError:  # pragma: no cover - depends on optional dependency
@@ -67,23 +67,46 @@ class DocumentStore:
         Returns:
             Document ID
         """
+        doc_id, added = self._insert(document)
+
+        if added and self.storage_path:
+            self._save_to_disk()
+
+        return doc_id
+
+    def add_many(self, documents: Iterable[Document]) -> list[str]:
+        """
+        Add several documents, persisting once instead of after each one.
+
+        Returns:
+            Document IDs in input order (existing IDs for duplicates)
+        """
+        doc_ids = []
+        any_added = False
+        for document in documents:
+            doc_id, added = self._insert(document)
+            doc_ids.append(doc_id)
+            any_added = any_added or added
+
+        if any_added and self.storage_path:
+            self._save_to_disk()
+
+        return doc_ids
+
+    def _insert(self, document: Document) -> tuple[str, bool]:
+        """Insert a document unless its content is already stored."""
         # Compute hash if not set
         if not document.content_hash:
             document.compute_hash()
 
         # Check for duplicates by hash
         if document.content_hash in self._by_hash:
-            existing_id = self._by_hash[document.content_hash]
             # Return existing ID if content matches
-            return existing_id
+            return self._by_hash[document.content_hash], False
 
         self._documents[document.id] = document
         self._by_hash[document.content_hash] = document.id
-
-        if self.storage_path:
-            self._save_to_disk()
-
-        return document.id
+        return document.id, True
 
     def get(self, doc_id: str) -> Document | None:
         """Get document by ID."""
@@ -0,0 +1,33 @@
+"""Tests for the Weaver integration module."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from origin.modules import weaver
+
+
+class TestCompress:
+    def test_compress_roundtrip_with_config(self):
+        data = b"hello world " * 200
+        container = weaver.compress_bytes(data, {"block_size": 4096, "include_sha256": True})
+        assert weaver.decompress_bytes(container) == data
+
+
+class TestPhraseWeaveDictionary:
+    def test_str_valued_dictionary(self):
+        raw = b"hello world hello"
+        woven, _ = weaver.phraseweave_encode(raw, {1: "hello", 2: "world"})
+        assert woven == weaver.phraseweave_encode(raw, {1: b"hello", 2: b"world"})[0]
+        assert weaver.phraseweave_decode(woven, {1: "hello", 2: "world"}) == raw
+        assert weaver.phraseweave_decode(woven, {1: b"hello", 2: b"world"}) == raw
+
+    def test_shared_dictionary_is_read_only(self):
+        dict_obj = weaver._phraseweave_dictionary(weaver._dictionary_entries({1: b"hello"}))
+        try:
+            dict_obj.add_entry(2, b"world")
+            assert False, "Should have raised"
+        except TypeError:
+            pass
+        assert list(dict_obj.entries) == [1]
@@ -0,0 +1,47 @@
+"""Tests for OI-FAR vault bootstrap."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from origin.oi_far.cli import OIFarRuntime
+
+
+PACK_YAML = """\
+id: c0001_test_pack
+title: Test Pack
+summary: A pack used to exercise bootstrap.
+claims:
+  - Bootstrap compiles every pack into bricks.
+  - text: Bricks keep the provenance of their source pack.
+    confidence: 0.9
+"""
+
+
+def _make_vault(root):
+    pack_dir = root / "knowledge" / "packs" / "c0001_test_pack"
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "pack.yaml").write_text(PACK_YAML, encoding="utf-8")
+    return root
+
+
+class TestBootstrap:
+    def test_bricks_carry_document_content_hash(self, tmp_path):
+        runtime = OIFarRuntime(vault_path=_make_vault(tmp_path))
+
+        bricks = runtime.brick_store.list_all()
+        assert bricks
+        for brick in bricks:
+            doc = runtime.document_store.get(brick.provenance.source_id)
+            assert doc is not None
+            assert doc.content_hash
+            assert brick.provenance.content_hash == doc.content_hash
+
+    def test_bootstrap_persists_stores(self, tmp_path):
+        vault = _make_vault(tmp_path)
+        first = OIFarRuntime(vault_path=vault)
+
+        reloaded = OIFarRuntime(vault_path=vault)
+        assert reloaded.brick_store.count() == first.brick_store.count()
+        assert reloaded.document_store.count() == first.document_store.count() == 1